@@ -1,28 +1,34 @@
 from fastapi import FastAPI, APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 import os
+import sys
 import logging
 from pathlib import Path
 from pydantic import BaseModel
 from typing import Dict, List, Optional
+from dataclasses import dataclass
+from collections import defaultdict, deque
+from functools import lru_cache
 import uuid
 import random
 import asyncio
 import string
+import time
 from datetime import datetime, timezone
+import orjson
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # Create the main app
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 
 # In-memory game storage
 game_sessions: Dict[str, dict] = {}
-active_connections: Dict[str, Dict[str, WebSocket]] = {}  # {session_id: {player_id: websocket}}
+active_connections: Dict[str, Dict[str, "PlayerConnection"]] = defaultdict(dict)  # {session_id: {player_id: PlayerConnection}}
 
 # Game configuration
 ROOMS_CONFIG = {
@@ -31,6 +37,37 @@ ROOMS_CONFIG = {
     "upper_floor": ["Chambre Cérémoniale", "Laboratoire", "Salle des Miroirs", "Sanctuaire"]
 }
 
+# Intern room and floor names so every structure keyed on them shares the same string objects
+ROOMS_CONFIG = {sys.intern(floor): [sys.intern(room) for room in rooms] for floor, rooms in ROOMS_CONFIG.items()}
+
+# Static room lookups derived once from ROOMS_CONFIG
+FLOORS = tuple(ROOMS_CONFIG)
+ALL_ROOMS = tuple((room, floor) for floor, rooms in ROOMS_CONFIG.items() for room in rooms)
+ROOM_TO_FLOOR = {room: floor for room, floor in ALL_ROOMS}
+# Floor names as shown in event messages
+FLOOR_NAMES_FR = {
+    "basement": "🕳️ Sous-sol",
+    "ground_floor": "🏰 Rez-de-chaussée",
+    "upper_floor": "🕯️ Étage"
+}
+
+# Initial state of every room, WITHOUT any keys or medikit ("floor" and "eliminated_players" are set per room)
+ROOM_TEMPLATE = {
+    "has_key": False,
+    "has_medikit": False,
+    "locked": False,
+    "trapped": False,  # NEW: for piege power
+    "highlighted": False,  # NEW: for vision power
+    "has_quest": False,  # NEW: for quest system
+    "quest_class": None,  # NEW: class required for the quest
+    "poisoned_turns_remaining": 0,  # NEW: for toxine power (0-3 turns)
+    "has_mimic": False,  # NEW: for mimic power
+    "has_crystal": False,  # NEW: for crystal system
+    "teleportation_trap": False,  # NEW: for teleportation power (entrance trap ➡️🌀)
+    "teleportation_exit": False,  # NEW: for teleportation power (exit portal 🌀➡️)
+    "teleportation_target_room": None  # NEW: destination room for teleportation
+}
+
 # Avatar images by role with their associated classes
 SURVIVOR_AVATARS = [
     {"path": "/avatars/Archère.png", "class": "Archère"},
@@ -50,14 +87,28 @@ KILLER_AVATARS = [
 
 # All avatars (for validation)
 ALL_AVATARS = SURVIVOR_AVATARS + KILLER_AVATARS
+AVATAR_CLASS_BY_PATH = {avatar["path"]: avatar["class"] for avatar in ALL_AVATARS}
+
+# Conspiracy mode role distribution by player count
+CONSPIRACY_ROLE_DISTRIBUTION = {
+    3: {"survivors": 2, "killers": 1},
+    4: {"survivors": 2, "killers": 2},
+    5: {"survivors": 3, "killers": 2},
+    6: {"survivors": 4, "killers": 2},
+    7: {"survivors": 4, "killers": 3},
+    8: {"survivors": 5, "killers": 3}
+}
+
+# Game over messages by winner: (message for survivors, message for killers)
+GAME_OVER_MESSAGES = {
+    "survivors": ("🎉 VICTOIRE ! Le cristal a été détruit ! Vous vous êtes échappés !", "💀 DEFAITE ! Le cristal a été détruit..."),
+    "killers": ("🎉 DEFAITE ! Tous les survivants ont été éliminés...", "💀 VICTOIRE ! Tous les survivants ont été éliminés ..."),
+}
 
 # Helper function to get class from avatar path
 def get_avatar_class(avatar_path: str) -> Optional[str]:
     """Get the class associated with an avatar path"""
-    for avatar in ALL_AVATARS:
-        if avatar["path"] == avatar_path:
-            return avatar["class"]
-    return None
+    return AVATAR_CLASS_BY_PATH.get(avatar_path)
 
 # Models
 class CreateGameRequest(BaseModel):
@@ -71,52 +122,66 @@ class JoinGameRequest(BaseModel):
     player_avatar: str
     role: str  # "survivor" or "killer"
 
-class StartGameRequest(BaseModel):
-    pass
+# Max number of serialized messages waiting for a slow client before it is dropped
+OUTBOUND_QUEUE_SIZE = 256
+
+# Delay used to coalesce consecutive state_update broadcasts into one (seconds)
+STATE_FLUSH_DELAY = 0.03
 
-class PlayerAction(BaseModel):
-    action: str  # "select_room", "use_medikit"
-    room: Optional[str] = None
-    target_player: Optional[str] = None
+# Errors raised by a WebSocket send once the client has gone away
+WEBSOCKET_SEND_ERRORS = (WebSocketDisconnect, RuntimeError, ConnectionError)
+
+# A client that does not accept a message for this long is disconnected (seconds)
+SEND_TIMEOUT = 10
+
+@dataclass
+class PlayerConnection:
+    """A player's WebSocket and the outbound queue drained by its writer task"""
+    websocket: WebSocket
+    queue: asyncio.Queue
+    role: Optional[str] = None  # player's role, kept in sync so broadcasts can filter without game lookups
+    writer: Optional[asyncio.Task] = None
+    state_synced: bool = False  # has received a full in-game state, so state_patch messages can follow
+
+    def enqueue(self, payload: str) -> bool:
+        """Queue an already-serialized message; returns False if the client is too far behind"""
+        try:
+            self.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            return False
 
 # Helper functions
+SHORT_CODE_CHARS = string.ascii_uppercase + string.digits
+SHORT_CODE_LENGTH = 4
+# Session codes are what lets someone join a game: draw them from the OS random source
+SHORT_CODE_RANDOM = random.SystemRandom()
+
+# Time given to the toxin death videos before the game over messages (seconds)
+TOXIN_DEATH_VIDEO_DELAY = 5
+
+# Only the most recent events are kept in the game log sent to clients
+MAX_GAME_EVENTS = 50
+
+# Sessions nobody has been connected to for this long are removed (seconds)
+SESSION_IDLE_TTL = 600
+SESSION_REAP_INTERVAL = 300
+
 def generate_short_code() -> str:
     """Generate a short 4-character alphanumeric code"""
-    characters = string.ascii_uppercase + string.digits
     while True:
-        code = ''.join(random.choice(characters) for _ in range(4))
+        code = ''.join(SHORT_CODE_RANDOM.choices(SHORT_CODE_CHARS, k=SHORT_CODE_LENGTH))
         # Check if code already exists
         if code not in game_sessions:
             return code
 
 def create_game_state(host_id: str, host_name: str, host_avatar: str, host_role: str) -> dict:
     """Initialize a new game state"""
-    all_rooms = []
-    for floor, rooms in ROOMS_CONFIG.items():
-        for room in rooms:
-            all_rooms.append({"name": room, "floor": floor})
-
-    # Initialize rooms WITHOUT any keys or medikit
-    rooms_state = {}
-    for room_info in all_rooms:
-        room_name = room_info["name"]
-        rooms_state[room_name] = {
-            "floor": room_info["floor"],
-            "has_key": False,
-            "has_medikit": False,
-            "locked": False,
-            "eliminated_players": [],
-            "trapped": False,  # NEW: for piege power
-            "highlighted": False,  # NEW: for vision power
-            "has_quest": False,  # NEW: for quest system
-            "quest_class": None,  # NEW: class required for the quest
-            "poisoned_turns_remaining": 0,  # NEW: for toxine power (0-3 turns)
-            "has_mimic": False,  # NEW: for mimic power
-            "has_crystal": False,  # NEW: for crystal system
-            "teleportation_trap": False,  # NEW: for teleportation power (entrance trap ➡️🌀)
-            "teleportation_exit": False,  # NEW: for teleportation power (exit portal 🌀➡️)
-            "teleportation_target_room": None  # NEW: destination room for teleportation
-        }
+    # Initialize rooms WITHOUT any keys or medikit (the template only holds immutable values)
+    rooms_state = {
+        room_name: {"floor": floor, **ROOM_TEMPLATE, "eliminated_players": []}
+        for room_name, floor in ALL_ROOMS
+    }
 
     # Get character class from avatar
     character_class = get_avatar_class(host_avatar)
@@ -146,22 +211,65 @@ def create_game_state(host_id: str, host_name: str, host_avatar: str, host_role:
         "game_started": False,
         "turn": 0,
         "phase": "waiting",  # waiting, survivor_selection, killer_power_selection, killer_selection, processing, game_over, rage_second_selection
-        "events": [],
+        "events": deque(maxlen=MAX_GAME_EVENTS),
         "pending_actions": {},
         "should_place_next_key": False,
         "conspiracy_mode": False,  # NEW: conspiracy mode flag
         "active_powers": {},  # NEW: {power_name: {used_by: [player_ids], data: {...}}}
         "pending_power_selections": {},  # NEW: {player_id: {selected_power: str, options: [str], action_data: {...}}}
-        "rooms_searched_this_key": [],  # NEW: track rooms searched since last key found (for vision power)
         "quests": [],  # NEW: list of all quests to complete
         "active_quest": None,  # NEW: current active quest {class: "Mage", room: "Les Cryptes"}
         "completed_quests": [],  # NEW: list of completed quest classes
         "rage_second_chances": {},  # NEW: {killer_id: {"can_select": True/False, "room_selected": None}}
         "crystal_spawned": False,  # NEW: whether crystal has been spawned
         "crystal_destroyed": False,  # NEW: whether crystal has been destroyed (victory condition)
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": time.time(),  # Formatted as ISO 8601 in public_game_state()
+        # Server-only bookkeeping: keys starting with "_" are never sent to clients
+        "_idle_since": time.time(),  # None while at least one player is connected
+        "_state_flush": None,  # Pending coalesced state_update task, see mark_state_dirty()
+        "_last_state_fields": {},  # {role: {key: serialized value or entries}} last in-game state sent to each role
+        "_survivor_ids": set(),  # player ids by role, indexed when the game starts
+        "_killer_ids": set(),
+        "_alive_survivor_ids": set(),  # kept in sync by set_player_eliminated()
+        "_alive_killer_ids": set(),
+        "_rooms_searched_this_key": set(),  # rooms searched since last key found (for vision power)
+        "_game_over_task": None,  # pending end_game_later() task, if any
+        "_scratch": {  # per-turn working containers, cleared and reused by process_turn
+            "survivors_actions": {},
+            "killers_actions": {},
+            "eliminated_rooms": set()
+        }
     }
 
+def index_player_roles(game_state: dict):
+    """Index player ids by role. Roles cannot change once the game has started."""
+    game_state["_survivor_ids"] = {pid for pid, p in game_state["players"].items() if p["role"] == "survivor"}
+    game_state["_killer_ids"] = {pid for pid, p in game_state["players"].items() if p["role"] == "killer"}
+    game_state["_alive_survivor_ids"] = {pid for pid in game_state["_survivor_ids"] if not game_state["players"][pid]["eliminated"]}
+    game_state["_alive_killer_ids"] = {pid for pid in game_state["_killer_ids"] if not game_state["players"][pid]["eliminated"]}
+
+def set_player_eliminated(game_state: dict, player_id: str, eliminated: bool):
+    """Set a player's eliminated flag, keeping the alive-player index in sync"""
+    player = game_state["players"][player_id]
+    player["eliminated"] = eliminated
+    alive_ids = game_state["_alive_survivor_ids"] if player["role"] == "survivor" else game_state["_alive_killer_ids"]
+    if eliminated:
+        alive_ids.discard(player_id)
+    else:
+        alive_ids.add(player_id)
+
+@lru_cache(maxsize=256)
+def format_timestamp(timestamp: float) -> str:
+    """ISO 8601 UTC string for an epoch timestamp (cached: game timestamps never change)"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+def public_game_state(game_state: dict) -> dict:
+    """Game state as sent to clients, without server-only keys (prefixed with "_")"""
+    public_state = {key: value for key, value in game_state.items() if key[0] != "_"}
+    public_state["created_at"] = format_timestamp(game_state["created_at"])
+    public_state["events"] = list(game_state["events"])
+    return public_state
+
 def generate_quests(survivors: list) -> list:
     """Generate a randomized list of quests based on survivor classes"""
     quests = []
@@ -177,97 +285,94 @@ def generate_quests(survivors: list) -> list:
     random.shuffle(quests)
     return quests
 
-def place_quest(game_state: dict, quest_class: str) -> Optional[str]:
-    """Place a quest in a random available room"""
-    available_rooms = []
+def get_killer_positions(game_state: dict) -> set:
+    """Rooms currently occupied by a killer (nothing is ever placed there)"""
+    players = game_state["players"]
+    return {players[pid]["current_room"] for pid in game_state["_killer_ids"] if players[pid]["current_room"]}
 
-    # Get all killer positions
-    killer_positions = [p["current_room"] for p in game_state["players"].values()
-                       if p["role"] == "killer" and p["current_room"]]
+def place_quest(game_state: dict, quest_class: str, killer_positions: Optional[set] = None) -> Optional[str]:
+    """Place a quest in a random available room"""
+    if killer_positions is None:
+        killer_positions = get_killer_positions(game_state)
 
-    for room_name, room_data in game_state["rooms"].items():
-        # Room is available if: not locked, no quest already, not a killer's position
+    # Room is available if: not locked, no quest already, not a killer's position
+    available_rooms = [
+        room_name for room_name, room_data in game_state["rooms"].items()
         if (not room_data["locked"] and
             not room_data.get("has_quest", False) and
-            room_name not in killer_positions):
-            available_rooms.append(room_name)
+            room_name not in killer_positions)
+    ]
 
     if available_rooms:
         selected_room = random.choice(available_rooms)
         game_state["rooms"][selected_room]["has_quest"] = True
         game_state["rooms"][selected_room]["quest_class"] = quest_class
-        logger.info(f"Placed quest for class {quest_class} in room: {selected_room}")
+        logger.info("Placed quest for class %s in room: %s", quest_class, selected_room)
         return selected_room
 
     return None
 
-def place_crystal(game_state: dict) -> Optional[str]:
+def place_crystal(game_state: dict, killer_positions: Optional[set] = None) -> Optional[str]:
     """Place the crystal in a random available room after all quests are completed"""
-    available_rooms = []
+    if killer_positions is None:
+        killer_positions = get_killer_positions(game_state)
 
-    # Get all killer positions
-    killer_positions = [p["current_room"] for p in game_state["players"].values()
-                       if p["role"] == "killer" and p["current_room"]]
-
-    for room_name, room_data in game_state["rooms"].items():
-        # Room is available if: not locked, no crystal already, not a killer's position
+    # Room is available if: not locked, no crystal already, not a killer's position
+    available_rooms = [
+        room_name for room_name, room_data in game_state["rooms"].items()
         if (not room_data["locked"] and
             not room_data.get("has_crystal", False) and
-            room_name not in killer_positions):
-            available_rooms.append(room_name)
+            room_name not in killer_positions)
+    ]
 
     if available_rooms:
         selected_room = random.choice(available_rooms)
         game_state["rooms"][selected_room]["has_crystal"] = True
         game_state["crystal_spawned"] = True
-        logger.info(f"Crystal placed in room: {selected_room}")
+        logger.info("Crystal placed in room: %s", selected_room)
         return selected_room
 
     return None
 
-def place_next_key(game_state: dict) -> Optional[str]:
+def place_next_key(game_state: dict, killer_positions: Optional[set] = None) -> Optional[str]:
     """Place ONE key randomly in an available room (legacy function kept for compatibility)"""
-    available_rooms = []
-
-    # Get all killer positions
-    killer_positions = [p["current_room"] for p in game_state["players"].values()
-                       if p["role"] == "killer" and p["current_room"]]
+    if killer_positions is None:
+        killer_positions = get_killer_positions(game_state)
 
-    for room_name, room_data in game_state["rooms"].items():
-        # Room is available if: not locked, no key already, not a killer's position
+    # Room is available if: not locked, no key already, not a killer's position
+    available_rooms = [
+        room_name for room_name, room_data in game_state["rooms"].items()
         if (not room_data["locked"] and
             not room_data["has_key"] and
-            room_name not in killer_positions):
-            available_rooms.append(room_name)
+            room_name not in killer_positions)
+    ]
 
     if available_rooms:
         selected_room = random.choice(available_rooms)
         game_state["rooms"][selected_room]["has_key"] = True
-        logger.info(f"Placed key in room: {selected_room}")
+        logger.info("Placed key in room: %s", selected_room)
         return selected_room
 
     return None
 
-def respawn_medikit(game_state: dict) -> Optional[str]:
+def respawn_medikit(game_state: dict, killer_positions: Optional[set] = None) -> Optional[str]:
     """Respawn medikit randomly in an available room after use"""
-    available_rooms = []
-
-    # Get all killer positions
-    killer_positions = [p["current_room"] for p in game_state["players"].values()\
-                       if p["role"] == "killer" and p["current_room"]]
+    if killer_positions is None:
+        killer_positions = get_killer_positions(game_state)
 
-    for room_name, room_data in game_state["rooms"].items():
-        # Room is available if: not locked, no medikit already, no key, not a killer's position
+    # Room is available if: not locked, no medikit already, no key, not a killer's position
+    available_rooms = [
+        room_name for room_name, room_data in game_state["rooms"].items()
         if (not room_data["locked"] and
             not room_data["has_medikit"] and
             not room_data["has_key"] and
-            room_name not in killer_positions):
-            available_rooms.append(room_name)
+            room_name not in killer_positions)
+    ]
 
     if available_rooms:
         selected_room = random.choice(available_rooms)
         game_state["rooms"][selected_room]["has_medikit"] = True
-        logger.info(f"Respawned medikit in room: {selected_room}")
+        logger.info("Respawned medikit in room: %s", selected_room)
         return selected_room
 
     return None
@@ -281,11 +386,10 @@ def get_survivor_floor_hints(game_state: dict) -> dict:
     floor_hints = {}
     
     for player_id, action in game_state.get("pending_actions", {}).items():
-        if player_id in game_state["players"]:
+        if player_id in game_state["_survivor_ids"]:
             player = game_state["players"][player_id]
-            if player["role"] == "survivor" and action.get("room"):
-                room_name = action["room"]
-                floor = game_state["rooms"][room_name]["floor"]
+            if action.get("room"):
+                floor = ROOM_TO_FLOOR[action["room"]]
                 if floor not in floor_hints:
                     floor_hints[floor] = []
                 floor_hints[floor].append(player["name"])
@@ -376,9 +480,17 @@ POWERS = {
     }
 }
 
-def get_random_powers(exclude_powers: list = []) -> list:
+POWER_KEYS = tuple(POWERS)
+
+# Message shown to the killers when a power is used, built from the power's "emoji Label" name
+POWER_USED_MESSAGES = {
+    power_key: "{} {{name}} utilise {} !".format(*power["name"].split(" ", 1))
+    for power_key, power in POWERS.items()
+}
+
+def get_random_powers(exclude_powers: tuple = ()) -> list:
     """Get 3 random unique powers"""
-    available = [p for p in POWERS.keys() if p not in exclude_powers]
+    available = [p for p in POWER_KEYS if p not in exclude_powers] if exclude_powers else POWER_KEYS
     return random.sample(available, min(3, len(available)))
 
 def validate_game_start(game: dict) -> tuple[bool, Optional[str]]:
@@ -388,9 +500,9 @@ def validate_game_start(game: dict) -> tuple[bool, Optional[str]]:
     """
     players = game["players"]
     
-    # Count players by role
-    survivors = [p for p in players.values() if p["role"] == "survivor"]
-    killers = [p for p in players.values() if p["role"] == "killer"]
+    # Players by role (the role index is built before validation)
+    survivors = [players[pid] for pid in game["_survivor_ids"]]
+    killers = game["_killer_ids"]
     
     # Check 1: At least 1 survivor
     if len(survivors) < 1:
@@ -416,11 +528,8 @@ async def check_power_selection_complete(session_id: str):
     """Check if all killers have completed their power selection"""
     game = game_sessions[session_id]
     
-    alive_killers = [p for p in game["players"].values() if p["role"] == "killer" and not p["eliminated"]]
-    
     all_complete = True
-    for killer in alive_killers:
-        killer_id = killer["id"]
+    for killer_id in game["_alive_killer_ids"]:
         if killer_id not in game["pending_power_selections"]:
             all_complete = False
             break
@@ -441,16 +550,132 @@ async def check_power_selection_complete(session_id: str):
             "message": "🔪 Les tueurs sélectionnent leur pièce"
         })
 
+def apply_vision(game: dict, player_id: str, selection: dict, power_events: list):
+    """Highlight rooms not searched since last key - distributed across floors"""
+    rooms_searched = game["_rooms_searched_this_key"]
+    
+    # Group unsearched rooms by floor for better distribution
+    unsearched_by_floor = {floor: [] for floor in FLOORS}
+    
+    for room_name, floor in ALL_ROOMS:
+        if room_name not in rooms_searched:
+            unsearched_by_floor[floor].append(room_name)
+    
+    # Highlight 50% of the unsearched rooms (rounded down), spread evenly across floors:
+    # each floor gets half of its own rooms, and half of the floors with an odd count
+    # (picked at random) get one extra room so the total is exactly 50%
+    quotas = {floor: len(rooms) // 2 for floor, rooms in unsearched_by_floor.items()}
+    odd_floors = [floor for floor, rooms in unsearched_by_floor.items() if len(rooms) % 2]
+    for floor in random.sample(odd_floors, len(odd_floors) // 2):
+        quotas[floor] += 1
+    
+    for floor, rooms in unsearched_by_floor.items():
+        for room_name in random.sample(rooms, quotas[floor]):
+            game["rooms"][room_name]["highlighted"] = True
+
+def apply_secousse(game: dict, player_id: str, selection: dict, power_events: list):
+    """Mark that key should move if not found"""
+    game["active_powers"]["secousse"]["data"]["should_relocate_key"] = True
+
+def apply_piege(game: dict, player_id: str, selection: dict, power_events: list):
+    """Trap selected rooms"""
+    action_data = selection.get("action_data", {})
+    trapped_rooms = action_data.get("rooms", [])
+    
+    for room_name in trapped_rooms:
+        if room_name in game["rooms"]:
+            game["rooms"][room_name]["trapped"] = True
+    
+    game["active_powers"]["piege"]["data"]["trapped_rooms"] = trapped_rooms
+
+def apply_toxine(game: dict, player_id: str, selection: dict, power_events: list):
+    """Poison selected room for 3 turns"""
+    action_data = selection.get("action_data", {})
+    poisoned_room = action_data.get("room")
+    
+    if poisoned_room and poisoned_room in game["rooms"]:
+        game["rooms"][poisoned_room]["poisoned_turns_remaining"] = 3
+    
+    game["active_powers"]["toxine"]["data"]["poisoned_room"] = poisoned_room
+
+def apply_traque(game: dict, player_id: str, selection: dict, power_events: list):
+    """Tell the killers whether survivors are on the selected floor"""
+    action_data = selection.get("action_data", {})
+    selected_floor = action_data.get("floor")
+    
+    if selected_floor:
+        # Check if any survivors are on the selected floor (stops at the first one found)
+        survivors_on_floor = any(
+            action.get("room") and ROOM_TO_FLOOR[action["room"]] == selected_floor
+            for pid, action in game["pending_actions"].items()
+            if pid in game["_survivor_ids"]
+        )
+        floor_name_fr = FLOOR_NAMES_FR.get(selected_floor, selected_floor)
+        if survivors_on_floor:
+            sound_event_msg = f"👂 Vous entendez du bruit {floor_name_fr}... Des survivants sont présents !"
+        else:
+            sound_event_msg = f"🤫 Aucun bruit {floor_name_fr}... Aucun survivant détecté."
+        game["events"].append({"message": sound_event_msg, "type": "sound_clue", "for_role": "killer"})
+        queue_event(power_events, sound_event_msg, role_filter="killer")
+
+def apply_barricade(game: dict, player_id: str, selection: dict, power_events: list):
+    """Lock selected rooms for next turn"""
+    action_data = selection.get("action_data", {})
+    locked_rooms = action_data.get("rooms", [])
+    
+    game["active_powers"]["barricade"]["data"]["locked_rooms_next_turn"] = locked_rooms
+
+def apply_rage(game: dict, player_id: str, selection: dict, power_events: list):
+    """Mark that this killer has rage power active for this turn"""
+    game["active_powers"]["rage"]["data"][player_id] = {
+        "has_second_chance": False,
+        "used_second_chance": False
+    }
+
+def apply_mimic(game: dict, player_id: str, selection: dict, power_events: list):
+    """Place mimics in selected rooms for next turn"""
+    action_data = selection.get("action_data", {})
+    mimic_rooms = action_data.get("rooms", [])
+    
+    for room_name in mimic_rooms:
+        if room_name in game["rooms"]:
+            game["rooms"][room_name]["has_mimic"] = True
+    
+    game["active_powers"]["mimic"]["data"]["mimic_rooms"] = mimic_rooms
+
+def apply_teleportation(game: dict, player_id: str, selection: dict, power_events: list):
+    """Set teleportation trap (entrance) and exit portal in selected rooms"""
+    action_data = selection.get("action_data", {})
+    trap_room = action_data.get("trap_room")
+    exit_room = action_data.get("exit_room")
+    
+    if trap_room and trap_room in game["rooms"] and exit_room and exit_room in game["rooms"]:
+        game["rooms"][trap_room]["teleportation_trap"] = True
+        game["rooms"][trap_room]["teleportation_target_room"] = exit_room
+        game["rooms"][exit_room]["teleportation_exit"] = True
+    
+    game["active_powers"]["teleportation"]["data"]["trap_room"] = trap_room
+    game["active_powers"]["teleportation"]["data"]["exit_room"] = exit_room
+
+# Power-specific logic, by power key
+POWER_EFFECTS = {
+    "vision": apply_vision,
+    "secousse": apply_secousse,
+    "piege": apply_piege,
+    "toxine": apply_toxine,
+    "traque": apply_traque,
+    "barricade": apply_barricade,
+    "rage": apply_rage,
+    "mimic": apply_mimic,
+    "teleportation": apply_teleportation
+}
+
 async def apply_powers(session_id: str):
     """Apply all selected powers"""
     game = game_sessions[session_id]
-    game["active_powers"] = {}
-    
-    floor_names = {
-        "basement": "🕳️ Sous-sol",
-        "ground_floor": "🏰 Rez-de-chaussée",
-        "upper_floor": "🕯️ Étage"
-    }
+    game["active_powers"].clear()
+    # Power announcements are sent together once every power has been applied
+    power_events = []
     
     for player_id, selection in game["pending_power_selections"].items():
         power_name = selection["selected_power"]
@@ -469,188 +694,52 @@ async def apply_powers(session_id: str):
         game["active_powers"][power_name]["used_by"].append(player_id)
         
         # Apply power-specific logic
-        if power_name == "vision":
-            # Highlight rooms not searched since last key - distributed across floors
-            rooms_searched = game.get("rooms_searched_this_key", [])
-            
-            # Group unsearched rooms by floor for better distribution
-            unsearched_by_floor = {
-                "basement": [],
-                "ground_floor": [],
-                "upper_floor": []
-            }
-            
-            for room_name, room_data in game["rooms"].items():
-                if room_name not in rooms_searched:
-                    floor = room_data.get("floor", "ground_floor")
-                    unsearched_by_floor[floor].append(room_name)
-            
-            # Calculate total number to highlight (50% rounded down)
-            total_unsearched = sum(len(rooms) for rooms in unsearched_by_floor.values())
-            num_to_highlight = total_unsearched // 2
-            
-            # Select rooms with better distribution across floors
-            rooms_to_highlight = []
-            if num_to_highlight > 0 and total_unsearched > 0:
-                # Create a list of all unsearched rooms with their floor info
-                all_unsearched_with_floor = []
-                for floor, rooms in unsearched_by_floor.items():
-                    for room in rooms:
-                        all_unsearched_with_floor.append((room, floor))
-                
-                # Shuffle to randomize
-                random.shuffle(all_unsearched_with_floor)
-                
-                # Use round-robin selection to distribute across floors
-                selected_count = 0
-                floor_indices = {floor: 0 for floor in unsearched_by_floor.keys()}
-                
-                # Keep cycling through floors until we have enough selections
-                while selected_count < num_to_highlight:
-                    # Shuffle floor order for each round to add more randomness
-                    floors = [f for f in unsearched_by_floor.keys() if unsearched_by_floor[f]]
-                    random.shuffle(floors)
-                    
-                    for floor in floors:
-                        if selected_count >= num_to_highlight:
-                            break
-                        
-                        floor_rooms = unsearched_by_floor[floor]
-                        if floor_indices[floor] < len(floor_rooms):
-                            # Select next room from this floor
-                            room = floor_rooms[floor_indices[floor]]
-                            rooms_to_highlight.append(room)
-                            floor_indices[floor] += 1
-                            selected_count += 1
-                    
-                    # Safety check to avoid infinite loop
-                    if all(floor_indices[f] >= len(unsearched_by_floor[f]) for f in floors):
-                        break
-                
-                # Highlight selected rooms
-                for room_name in rooms_to_highlight:
-                    game["rooms"][room_name]["highlighted"] = True
-            
-            event_msg = f"👁️ {player['name']} utilise Vision !"
-            game["events"].append({"message": event_msg, "type": "power_used", "for_role": "killer"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg}, role_filter="killer")
-        
-        elif power_name == "secousse":
-            # Mark that key should move if not found
-            game["active_powers"][power_name]["data"]["should_relocate_key"] = True
-            
-            event_msg = f"↩️ {player['name']} utilise Secousse !"
-            game["events"].append({"message": event_msg, "type": "power_used", "for_role": "killer"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg}, role_filter="killer")
-        
-        elif power_name == "piege":
-            # Trap selected rooms
-            action_data = selection.get("action_data", {})
-            trapped_rooms = action_data.get("rooms", [])
-            
-            for room_name in trapped_rooms:
-                if room_name in game["rooms"]:
-                    game["rooms"][room_name]["trapped"] = True
-            
-            game["active_powers"][power_name]["data"]["trapped_rooms"] = trapped_rooms
-            
-            event_msg = f"🥶 {player['name']} utilise Blizzard !"
-            game["events"].append({"message": event_msg, "type": "power_used", "for_role": "killer"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg}, role_filter="killer")
+        POWER_EFFECTS[power_name](game, player_id, selection, power_events)
         
-        elif power_name == "toxine":
-            # Poison selected room for 3 turns
-            action_data = selection.get("action_data", {})
-            poisoned_room = action_data.get("room")
-            
-            if poisoned_room and poisoned_room in game["rooms"]:
-                game["rooms"][poisoned_room]["poisoned_turns_remaining"] = 3
-            
-            game["active_powers"][power_name]["data"]["poisoned_room"] = poisoned_room
-            
-            event_msg = f"😷 {player['name']} utilise Toxine !"
-            game["events"].append({"message": event_msg, "type": "power_used", "for_role": "killer"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg}, role_filter="killer")
-        
-        elif power_name == "traque":
-            # Get selected floor from action_data
-            action_data = selection.get("action_data", {})
-            selected_floor = action_data.get("floor")
-            
-            if selected_floor:
-                # Get floor hints for all survivors
-                floor_hints = get_survivor_floor_hints(game)
-                
-                # Check if any survivors are on the selected floor
-                if selected_floor in floor_hints:
-                    floor_name_fr = floor_names.get(selected_floor, selected_floor)
-                    sound_event_msg = f"👂 Vous entendez du bruit {floor_name_fr}... Des survivants sont présents !"
-                    game["events"].append({"message": sound_event_msg, "type": "sound_clue", "for_role": "killer"})
-                    await broadcast_to_session(session_id, {"type": "event", "message": sound_event_msg}, role_filter="killer")
-                else:
-                    floor_name_fr = floor_names.get(selected_floor, selected_floor)
-                    sound_event_msg = f"🤫 Aucun bruit {floor_name_fr}... Aucun survivant détecté."
-                    game["events"].append({"message": sound_event_msg, "type": "sound_clue", "for_role": "killer"})
-                    await broadcast_to_session(session_id, {"type": "event", "message": sound_event_msg}, role_filter="killer")
-            
-            event_msg = f"🔊 {player['name']} utilise Traque !"
-            game["events"].append({"message": event_msg, "type": "power_used", "for_role": "killer"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg}, role_filter="killer")
-        
-        elif power_name == "barricade":
-            # Lock selected rooms for next turn
-            action_data = selection.get("action_data", {})
-            locked_rooms = action_data.get("rooms", [])
-            
-            game["active_powers"][power_name]["data"]["locked_rooms_next_turn"] = locked_rooms
-            
-            event_msg = f"🔒 {player['name']} utilise Barricade !"
-            game["events"].append({"message": event_msg, "type": "power_used", "for_role": "killer"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg}, role_filter="killer")
-        
-        elif power_name == "rage":
-            # Mark that this killer has rage power active for this turn
-            game["active_powers"][power_name]["data"][player_id] = {
-                "has_second_chance": False,
-                "used_second_chance": False
-            }
-            
-            event_msg = f"😡 {player['name']} utilise Rage !"
-            game["events"].append({"message": event_msg, "type": "power_used", "for_role": "killer"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg}, role_filter="killer")
-        
-        elif power_name == "mimic":
-            # Place mimics in selected rooms for next turn
-            action_data = selection.get("action_data", {})
-            mimic_rooms = action_data.get("rooms", [])
-            
-            for room_name in mimic_rooms:
-                if room_name in game["rooms"]:
-                    game["rooms"][room_name]["has_mimic"] = True
-            
-            game["active_powers"][power_name]["data"]["mimic_rooms"] = mimic_rooms
-            
-            event_msg = f"💰 {player['name']} utilise Mimic !"
-            game["events"].append({"message": event_msg, "type": "power_used", "for_role": "killer"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg}, role_filter="killer")
-        
-        elif power_name == "teleportation":
-            # Set teleportation trap (entrance) and exit portal in selected rooms
-            action_data = selection.get("action_data", {})
-            trap_room = action_data.get("trap_room")
-            exit_room = action_data.get("exit_room")
-            
-            if trap_room and trap_room in game["rooms"] and exit_room and exit_room in game["rooms"]:
-                game["rooms"][trap_room]["teleportation_trap"] = True
-                game["rooms"][trap_room]["teleportation_target_room"] = exit_room
-                game["rooms"][exit_room]["teleportation_exit"] = True
-            
-            game["active_powers"][power_name]["data"]["trap_room"] = trap_room
-            game["active_powers"][power_name]["data"]["exit_room"] = exit_room
-            
-            event_msg = f"🌀 {player['name']} utilise Piège de Téléportation !"
-            game["events"].append({"message": event_msg, "type": "power_used", "for_role": "killer"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg}, role_filter="killer")
+        # Announce the power to the killers (after Traque's sound clue)
+        event_msg = POWER_USED_MESSAGES[power_name].format(name=player["name"])
+        game["events"].append({"message": event_msg, "type": "power_used", "for_role": "killer"})
+        queue_event(power_events, event_msg, role_filter="killer")
+    
+    await flush_events(session_id, power_events)
+
+def _filter_room(room_data: dict, player_role: str) -> dict:
+    """Return the room as seen by a role, reusing the original dict when nothing is hidden"""
+    if player_role == "survivor":
+        # Survivors see trap_triggered but not highlighted or just trapped
+        hide_trap = room_data["trapped"] and not room_data.get("trap_triggered", False)
+        if not room_data["highlighted"] and not hide_trap:
+            return room_data
+        room_copy = room_data.copy()
+        room_copy["highlighted"] = False
+        if hide_trap:
+            room_copy["trapped"] = False
+        return room_copy
+
+    if player_role == "killer" and "trap_triggered" in room_data:
+        # Killers see trapped and highlighted, but not trap_triggered
+        room_copy = room_data.copy()
+        del room_copy["trap_triggered"]
+        return room_copy
+
+    return room_data
+
+def _filter_player(player_data: dict, player_role: str) -> dict:
+    """Return the player as seen by a role, reusing the original dict when nothing is hidden"""
+    # Each role sees its own side's positions and eliminated players
+    if player_data["role"] == player_role or player_data["eliminated"]:
+        return player_data
+
+    if player_role == "survivor":
+        # Hide killer position (but keep player in list without current_room)
+        if player_data["current_room"] is None:
+            return player_data
+        return {**player_data, "current_room": None}
+
+    # Hide survivor position and gold from killers
+    if player_data["current_room"] is None and not player_data.get("gold"):
+        return player_data
+    return {**player_data, "current_room": None, "gold": 0}
 
 def filter_game_state(game_state: dict, player_role: str) -> dict:
     """
@@ -658,105 +747,304 @@ def filter_game_state(game_state: dict, player_role: str) -> dict:
     - Survivors see: other survivors' positions + eliminated players
     - Killers see: other killers' positions + eliminated players + highlighted rooms (Vision power)
     - pending_actions are filtered to only show actions from same role
+    Unchanged rooms and players are shared with the live state rather than copied.
     """
-    filtered_state = game_state.copy()
-    filtered_state["players"] = {}
-    filtered_state["pending_actions"] = {}
-    
-    # Filter rooms based on role
-    filtered_state["rooms"] = {}
-    for room_name, room_data in game_state["rooms"].items():
-        room_copy = room_data.copy()
-        
-        if player_role == "survivor":
-            # Survivors see trap_triggered but not highlighted or just trapped
-            room_copy["highlighted"] = False
-            if not room_copy.get("trap_triggered", False):
-                room_copy["trapped"] = False
-        elif player_role == "killer":
-            # Killers see trapped and highlighted, but not trap_triggered
-            room_copy.pop("trap_triggered", None)
-        
-        filtered_state["rooms"][room_name] = room_copy
-
-    for pid, player_data in game_state["players"].items():
-        player_copy = player_data.copy()
+    players = game_state["players"]
+    rooms = {room_name: _filter_room(room_data, player_role) for room_name, room_data in game_state["rooms"].items()}
+    filtered_players = {pid: _filter_player(player_data, player_role) for pid, player_data in players.items()}
+
+    # Filter pending_actions: only show actions from same role (roles are indexed at game start)
+    same_role_ids = game_state["_survivor_ids"] if player_role == "survivor" else game_state["_killer_ids"]
+    pending_actions = {
+        pid: action for pid, action in game_state.get("pending_actions", {}).items()
+        if pid in same_role_ids
+    }
 
-        if player_role == "survivor":
-            # Survivors see all survivors' positions and eliminated players
-            if player_data["role"] == "survivor" or player_data["eliminated"]:
-                filtered_state["players"][pid] = player_copy
-            else:
-                # Hide killer position (but keep player in list without current_room)
-                player_copy["current_room"] = None
-                filtered_state["players"][pid] = player_copy
-
-        elif player_role == "killer":
-            # Killers see other killers' positions and eliminated players
-            if player_data["role"] == "killer" or player_data["eliminated"]:
-                filtered_state["players"][pid] = player_copy
-            else:
-                # Hide survivor position (but keep player in list without current_room)
-                player_copy["current_room"] = None
-                player_copy["gold"] = 0  # Hide gold from killers
-                filtered_state["players"][pid] = player_copy
-
-    # Filter pending_actions: only show actions from same role
-    for pid, action in game_state.get("pending_actions", {}).items():
-        if pid in game_state["players"]:
-            player = game_state["players"][pid]
-            if player["role"] == player_role:
-                filtered_state["pending_actions"][pid] = action
-    
     # Filter pending_power_selections: only show to killers
     if player_role == "killer":
-        filtered_state["pending_power_selections"] = game_state.get("pending_power_selections", {})
+        pending_power_selections = game_state.get("pending_power_selections", {})
     else:
-        filtered_state["pending_power_selections"] = {}
-
+        pending_power_selections = {}
+
+    # public_game_state() already returns a new top-level dict: fill in the role's view in place
+    filtered_state = public_game_state(game_state)
+    filtered_state["rooms"] = rooms
+    filtered_state["players"] = filtered_players
+    filtered_state["pending_actions"] = pending_actions
+    filtered_state["pending_power_selections"] = pending_power_selections
     return filtered_state
 
+def encode_message(message: dict) -> str:
+    """Serialize a WebSocket message once with orjson so it can be sent as-is to many clients"""
+    return orjson.dumps(message).decode()
+
+async def connection_writer(session_id: str, player_id: str, connection: PlayerConnection):
+    """Drain a player's outbound queue onto their WebSocket, one message at a time"""
+    try:
+        while True:
+            payload = await connection.queue.get()
+            await asyncio.wait_for(connection.websocket.send_text(payload), SEND_TIMEOUT)
+    except WEBSOCKET_SEND_ERRORS:
+        drop_connection(session_id, player_id, connection)
+    except asyncio.TimeoutError:
+        # The client stopped reading: close the socket rather than leave it open but silent
+        drop_connection(session_id, player_id, connection)
+        try:
+            await asyncio.wait_for(connection.websocket.close(code=1011), SEND_TIMEOUT)
+        except (*WEBSOCKET_SEND_ERRORS, asyncio.TimeoutError):
+            pass
+
+def open_connection(session_id: str, player_id: str, websocket: WebSocket) -> PlayerConnection:
+    """Register a player's WebSocket and start its writer task, replacing any previous connection"""
+    drop_connection(session_id, player_id)
+    player = game_sessions[session_id]["players"].get(player_id)
+    connection = PlayerConnection(
+        websocket=websocket,
+        queue=asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE),
+        role=player["role"] if player else None
+    )
+    connection.writer = asyncio.create_task(connection_writer(session_id, player_id, connection))
+    active_connections[session_id][player_id] = connection
+    game_sessions[session_id]["_idle_since"] = None
+    return connection
+
+def drop_connection(session_id: str, player_id: str, connection: Optional[PlayerConnection] = None):
+    """Unregister a player's connection and stop its writer task.
+    If connection is given, only drop it if it is still the player's current one."""
+    connections = active_connections.get(session_id, {})
+    current = connections.get(player_id)
+    if current is None or (connection is not None and current is not connection):
+        return
+    del connections[player_id]
+    if current.writer and current.writer is not asyncio.current_task():
+        current.writer.cancel()
+    if not connections and session_id in game_sessions:
+        game_sessions[session_id]["_idle_since"] = time.time()
+
+async def reap_idle_sessions():
+    """Periodically remove sessions that nobody has been connected to for SESSION_IDLE_TTL"""
+    while True:
+        await asyncio.sleep(SESSION_REAP_INTERVAL)
+        now = time.time()
+        for session_id, game in list(game_sessions.items()):
+            idle_since = game["_idle_since"]
+            if idle_since is not None and now - idle_since > SESSION_IDLE_TTL:
+                del game_sessions[session_id]
+                active_connections.pop(session_id, None)
+                logger.info("Removed idle session %s", session_id)
+
+def sync_connection_roles(session_id: str):
+    """Refresh the role cached on each connection after players' roles change"""
+    game = game_sessions[session_id]
+    game["_last_state_fields"] = {}
+    for player_id, connection in active_connections.get(session_id, {}).items():
+        player = game["players"].get(player_id)
+        connection.role = player["role"] if player else None
+        connection.state_synced = False
+
+def send_to_player(session_id: str, player_id: str, message: dict):
+    """Queue a message for a single connected player, if they are connected"""
+    flush_state(session_id)
+    connection = active_connections.get(session_id, {}).get(player_id)
+    if connection and not connection.enqueue(encode_message(message)):
+        drop_connection(session_id, player_id)
+
+# State fields patched entry by entry (dicts) or by appending (lists) instead of being resent whole
+KEYED_STATE_FIELDS = ("rooms", "players")
+APPENDED_STATE_FIELDS = ("events",)
+
+def join_state_field(part) -> bytes:
+    """Assemble a field serialized by encode_role_state back into one JSON value"""
+    if isinstance(part, dict):
+        return b"{" + b",".join(orjson.dumps(key) + b":" + value for key, value in part.items()) + b"}"
+    if isinstance(part, list):
+        return b"[" + b",".join(part) + b"]"
+    return part
+
+def encode_role_state(game_state: dict, role: str) -> tuple:
+    """
+    Serialize a role's view of the game both as a full state_update and as a state_patch
+    carrying only what changed since the last state sent to that role:
+    - "changes": top-level fields replaced whole
+    - "entries": rooms/players entries replaced inside their dict
+    - "appended": events dropped from the front ("drop") and added at the end ("items")
+    The patch is None when there is nothing to diff against.
+    """
+    fields = {}
+    for key, value in filter_game_state(game_state, role).items():
+        if key in KEYED_STATE_FIELDS:
+            fields[key] = {entry: orjson.dumps(item) for entry, item in value.items()}
+        elif key in APPENDED_STATE_FIELDS:
+            fields[key] = [orjson.dumps(item) for item in value]
+        else:
+            fields[key] = orjson.dumps(value)
+    previous = game_state["_last_state_fields"].get(role)
+    game_state["_last_state_fields"][role] = fields
+
+    full = b'{"type":"state_update","game":{' + b",".join(
+        orjson.dumps(key) + b":" + join_state_field(part) for key, part in fields.items()
+    ) + b"}}"
+    if previous is None or previous.keys() != fields.keys():
+        return full.decode(), None
+
+    changes, entries, appended = [], [], []
+    for key, part in fields.items():
+        before = previous[key]
+        if before == part:
+            continue
+        name = orjson.dumps(key) + b":"
+        if key in KEYED_STATE_FIELDS and before.keys() == part.keys():
+            entries.append(name + join_state_field({entry: value for entry, value in part.items() if before[entry] != value}))
+        elif key in APPENDED_STATE_FIELDS:
+            # Smallest number of old items to drop so the rest is a prefix of the new list
+            drop = next(count for count in range(len(before) + 1) if before[count:] == part[:len(before) - count])
+            items = join_state_field(part[len(before) - drop:])
+            appended.append(name + b'{"drop":' + str(drop).encode() + b',"items":' + items + b"}")
+        else:
+            changes.append(name + join_state_field(part))
+
+    patch = b'{"type":"state_patch","changes":{' + b",".join(changes) + b"}"
+    if entries:
+        patch += b',"entries":{' + b",".join(entries) + b"}"
+    if appended:
+        patch += b',"appended":{' + b",".join(appended) + b"}"
+    return full.decode(), (patch + b"}").decode()
+
+def has_listeners(session_id: str, role: Optional[str] = None) -> bool:
+    """Whether any player (optionally of the given role) is connected to the session"""
+    connections = active_connections.get(session_id)
+    if not connections:
+        return False
+    return role is None or any(connection.role == role for connection in connections.values())
+
 async def broadcast_to_session(session_id: str, message: dict, role_filter: Optional[str] = None):
     """
     Send message to all players in a session
     If role_filter is provided, only send to players with that role
     """
-    if session_id not in active_connections:
-        return
+    enqueue_broadcast(session_id, message, role_filter)
 
+def enqueue_broadcast(session_id: str, message: dict, role_filter: Optional[str] = None):
+    """Serialize a broadcast and queue it on every recipient's connection"""
     game = game_sessions.get(session_id)
     if not game:
         return
 
+    # Keep ordering: a pending coalesced state goes out before any other message,
+    # and an explicit state_update makes it redundant
+    if message.get("type") == "state_update":
+        cancel_state_flush(game)
+    else:
+        flush_state(session_id)
+
+    # Nobody to send to: skip filtering and serialization entirely
+    if not has_listeners(session_id, role_filter):
+        return
+
+    # If sending state_update during active gameplay, filter it once per role (not per player).
+    # In lobby, the unfiltered state is sent so everyone sees all players with is_host property.
+    # Each distinct payload is serialized exactly once and the text reused for every recipient.
+    # During play, players already holding their role's state only get the fields that changed.
+    payloads_by_role = {}
+    is_state_update = message.get("type") == "state_update"
+    if is_state_update:
+        if game.get("game_started", False):
+            connected_roles = {connection.role for connection in active_connections[session_id].values()}
+            for role in ("survivor", "killer"):
+                if (role_filter and role != role_filter) or role not in connected_roles:
+                    continue
+                payloads_by_role[role] = encode_role_state(game, role)
+    payload_all = None
+
+    # Hand the payload to each recipient's writer task; slow clients never block the broadcast
     disconnected = []
-    for player_id, websocket in active_connections[session_id].items():
+    for player_id, connection in active_connections[session_id].items():
         # Check if we should send to this player based on role_filter
-        if role_filter:
-            player = game["players"].get(player_id)
-            if not player or player["role"] != role_filter:
-                continue
+        if role_filter and connection.role != role_filter:
+            continue
 
-        try:
-            # If sending state_update, filter it based on player's role (only during active game)
-            if message.get("type") == "state_update" and player_id in game["players"]:
-                # Only filter game state during active gameplay, not in lobby
-                if game.get("game_started", False):
-                    player_role = game["players"][player_id]["role"]
-                    filtered_game = filter_game_state(game, player_role)
-                    filtered_message = message.copy()
-                    filtered_message["game"] = filtered_game
-                    await websocket.send_json(filtered_message)
-                else:
-                    # In lobby, send unfiltered state so everyone sees all players with is_host property
-                    await websocket.send_json(message)
+        if connection.role in payloads_by_role:
+            full_payload, patch_payload = payloads_by_role[connection.role]
+            if connection.state_synced and patch_payload is not None:
+                payload = patch_payload
             else:
-                await websocket.send_json(message)
-        except:
+                payload = full_payload
+                connection.state_synced = True
+        else:
+            if payload_all is None:
+                if is_state_update:
+                    # Unfiltered state is only built when someone actually receives it
+                    message = {**message, "game": public_game_state(message["game"])}
+                payload_all = encode_message(message)
+            payload = payload_all
+        if not connection.enqueue(payload):
             disconnected.append(player_id)
 
-    # Clean up disconnected players
+    # Clean up players whose outbound queue overflowed
     for player_id in disconnected:
-        del active_connections[session_id][player_id]
+        drop_connection(session_id, player_id)
+
+def mark_state_dirty(session_id: str):
+    """Schedule a state_update broadcast, coalescing all changes made within STATE_FLUSH_DELAY"""
+    game = game_sessions.get(session_id)
+    if game and game["_state_flush"] is None:
+        game["_state_flush"] = asyncio.create_task(flush_state_later(session_id))
+
+async def flush_state_later(session_id: str):
+    """Send the coalesced state_update once the delay has elapsed"""
+    await asyncio.sleep(STATE_FLUSH_DELAY)
+    flush_state(session_id)
+
+def cancel_state_flush(game: dict):
+    """Forget the pending coalesced state_update, if any"""
+    task = game["_state_flush"]
+    game["_state_flush"] = None
+    if task and task is not asyncio.current_task():
+        task.cancel()
+
+def flush_state(session_id: str):
+    """Send the pending coalesced state_update right away, if there is one"""
+    game = game_sessions.get(session_id)
+    if game and game["_state_flush"] is not None:
+        enqueue_broadcast(session_id, {"type": "state_update", "game": game})
+
+def queue_event(pending_events: list, event_msg: str, role_filter: Optional[str] = None):
+    """Buffer an event message to be sent with the next flush_events call"""
+    pending_events.append((role_filter, {"type": "event", "message": event_msg}))
+
+async def announce_game_over(session_id: str, winner: str, video_path: Optional[str] = None):
+    """Log and send the game over message of each role"""
+    game = game_sessions[session_id]
+    for role, message in zip(("survivor", "killer"), GAME_OVER_MESSAGES[winner]):
+        game["events"].append({"message": message, "type": "game_over", "for_role": role})
+    for role, message in zip(("survivor", "killer"), GAME_OVER_MESSAGES[winner]):
+        payload = {"type": "game_over", "winner": winner, "message": message}
+        if video_path:
+            payload["video_path"] = video_path
+        await broadcast_to_session(session_id, payload, role_filter=role)
+
+async def end_game_later(session_id: str, winner: str, delay: float):
+    """End the game after a delay, unless it was reset or removed in the meantime"""
+    game = game_sessions.get(session_id)
+    turn = game["turn"]
+    await asyncio.sleep(delay)
+    if game_sessions.get(session_id) is not game or game["phase"] != "processing" or game["turn"] != turn:
+        return
+    game["_game_over_task"] = None
+    game["phase"] = "game_over"
+    game["winner"] = winner
+    await announce_game_over(session_id, winner)
+    mark_state_dirty(session_id)
+
+async def flush_events(session_id: str, pending_events: list):
+    """Broadcast buffered events as a single turn_events frame per role_filter"""
+    events_by_role = {}
+    for role_filter, message in pending_events:
+        events_by_role.setdefault(role_filter, []).append(message)
+    pending_events.clear()
+
+    for role_filter, messages in events_by_role.items():
+        await broadcast_to_session(session_id, {"type": "turn_events", "events": messages}, role_filter=role_filter)
 
 async def process_turn(session_id: str):
     """Process a complete turn - survivors and killers have already selected their rooms"""
@@ -764,46 +1052,49 @@ async def process_turn(session_id: str):
     
     key_found_this_turn = False
 
+    # Events produced during the turn are sent together as one frame at each phase boundary
+    turn_events = []
+    active_powers = game["active_powers"]
+
     # At the start of the turn, place a new key if needed
     if game["should_place_next_key"]:
         placed_room = place_next_key(game)
         if placed_room:
             game["should_place_next_key"] = False
 
-    # Unlock previously locked rooms (except those locked by Barricade)
+    # Unlock previously locked rooms, apply Barricade locks for this turn and clear vision highlights in one pass
     barricade_locked_rooms = []
-    if "barricade" in game.get("active_powers", {}):
-        barricade_locked_rooms = game["active_powers"]["barricade"]["data"].get("locked_rooms_next_turn", [])
-    
+    if "barricade" in active_powers:
+        barricade_locked_rooms = active_powers["barricade"]["data"].get("locked_rooms_next_turn", [])
+    barricade_set = set(barricade_locked_rooms)
+
     for room_name, room_data in game["rooms"].items():
-        if room_data["locked"] and room_name not in barricade_locked_rooms:
-            room_data["locked"] = False
-    
-    # Apply Barricade locked rooms for next turn
+        room_data["locked"] = room_name in barricade_set
+        room_data["highlighted"] = False
+
     for room_name in barricade_locked_rooms:
         if room_name in game["rooms"]:
-            game["rooms"][room_name]["locked"] = True
             event_msg = f"🔒 La pièce {room_name} est barricadée pour ce tour."
             game["events"].append({"message": event_msg, "type": "room_locked"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg})
-    
-    # Clear vision highlights from rooms
-    for room_name, room_data in game["rooms"].items():
-        room_data["highlighted"] = False
+            queue_event(turn_events, event_msg)
     
     # NOTE: Traps are NOT cleared here anymore!
     # They need to persist until AFTER survivors make their selection in the next turn
     # Traps will be cleared in the survivor_selection phase after all survivors have selected
 
-    # Separate survivors and killers actions
-    survivors_actions = {}
-    killers_actions = {}
+    # Separate survivors and killers actions (reusing this game's scratch containers)
+    scratch = game["_scratch"]
+    survivors_actions = scratch["survivors_actions"]
+    killers_actions = scratch["killers_actions"]
+    eliminated_rooms = scratch["eliminated_rooms"]
+    survivors_actions.clear()
+    killers_actions.clear()
+    eliminated_rooms.clear()
 
     for player_id, action in game["pending_actions"].items():
-        player = game["players"][player_id]
-        if player["role"] == "survivor" and not player["eliminated"]:
+        if player_id in game["_alive_survivor_ids"]:
             survivors_actions[player_id] = action
-        elif player["role"] == "killer" and not player["eliminated"]:
+        elif player_id in game["_alive_killer_ids"]:
             killers_actions[player_id] = action
 
     # ============================================
@@ -826,7 +1117,7 @@ async def process_turn(session_id: str):
             player["has_medikit"] = True
             event_msg = f"⚗️ {player['name']} a trouvé la potion de résurrection et en est désormais le porteur."
             game["events"].append({"message": event_msg, "type": "medikit_found"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg})
+            queue_event(turn_events, event_msg)
 
         # Auto-revive: If survivor has medikit and enters room with eliminated player
         if player["has_medikit"] and room["eliminated_players"]:
@@ -834,7 +1125,7 @@ async def process_turn(session_id: str):
             target_player_id = room["eliminated_players"][0]
             if target_player_id in game["players"] and game["players"][target_player_id]["eliminated"]:
                 # Revive the player
-                game["players"][target_player_id]["eliminated"] = False
+                set_player_eliminated(game, target_player_id, False)
                 # Reset poison status when revived
                 game["players"][target_player_id]["poisoned_countdown"] = 0
                 player["has_medikit"] = False
@@ -842,14 +1133,14 @@ async def process_turn(session_id: str):
 
                 event_msg = f"💚 {player['name']} a ranimé {game['players'][target_player_id]['name']} !"
                 game["events"].append({"message": event_msg, "type": "revival"})
-                await broadcast_to_session(session_id, {"type": "event", "message": event_msg})
+                queue_event(turn_events, event_msg)
 
                 # Respawn the medikit
                 new_medikit_room = respawn_medikit(game)
                 if new_medikit_room:
                     respawn_msg = "⚗️ La potion de résurrection réapparaît quelque part dans la maison..."
                     game["events"].append({"message": respawn_msg, "type": "medikit_respawn"})
-                    await broadcast_to_session(session_id, {"type": "event", "message": respawn_msg})
+                    queue_event(turn_events, respawn_msg)
 
     # ============================================
     # PHASE 2: KILLERS PLAY SECOND
@@ -859,9 +1150,14 @@ async def process_turn(session_id: str):
     for player_id, action in killers_actions.items():
         game["players"][player_id]["current_room"] = action["room"]
 
+    # Alive survivors by room, built once for every killer's check (a room is emptied by its first killer)
+    survivors_by_room = {}
+    for survivor_id in game["_alive_survivor_ids"]:
+        survivors_by_room.setdefault(game["players"][survivor_id]["current_room"], []).append(survivor_id)
+
     # Check for eliminations (killers finding survivors in same room)
-    eliminated_rooms = []
     killers_with_rage_second_chance = {}  # {killer_id: True} for killers who get a second chance
+    rage_data_by_killer = active_powers["rage"]["data"] if "rage" in active_powers else {}
 
     for killer_id, killer_action in killers_actions.items():
         killer = game["players"][killer_id]
@@ -869,76 +1165,70 @@ async def process_turn(session_id: str):
 
         found_survivor = False
         # Check if any survivors are in the same room
-        for survivor_id, survivor in game["players"].items():
-            if (survivor["role"] == "survivor" and
-                not survivor["eliminated"] and
-                survivor["current_room"] == killer_room):
-
-                # Eliminate the survivor
-                survivor["eliminated"] = True
-                survivor["gold"] = 0  # Reset gold when eliminated
-                game["rooms"][killer_room]["eliminated_players"].append(survivor_id)
-                eliminated_rooms.append(killer_room)
-                found_survivor = True
-
-                # Get survivor class for death image
-                survivor_class = survivor.get("character_class", "")
-                death_image_path = f"/death/{survivor_class}.png" if survivor_class else ""
-
-                event_msg = f"💀 {survivor['name']} a été éliminé dans {killer_room} !"
-                game["events"].append({"message": event_msg, "type": "elimination"})
-                await broadcast_to_session(session_id, {"type": "event", "message": event_msg})
-                
-                # Send elimination popup to ALL players with dramatic effect
-                elimination_message = f"{killer['name']} a tué {survivor['name']} dans {killer_room}"
-                await broadcast_to_session(session_id, {
-                    "type": "killer_elimination_popup",
-                    "killer_name": killer['name'],
-                    "survivor_name": survivor['name'],
-                    "room_name": killer_room,
-                    "survivor_class": survivor_class,
-                    "death_image": death_image_path,
-                    "message": elimination_message
-                })
+        for survivor_id in survivors_by_room.pop(killer_room, ()):
+            survivor = game["players"][survivor_id]
+
+            # Eliminate the survivor
+            set_player_eliminated(game, survivor_id, True)
+            survivor["gold"] = 0  # Reset gold when eliminated
+            game["rooms"][killer_room]["eliminated_players"].append(survivor_id)
+            eliminated_rooms.add(killer_room)
+            found_survivor = True
+
+            # Get survivor class for death image
+            survivor_class = survivor.get("character_class", "")
+            death_image_path = f"/death/{survivor_class}.png" if survivor_class else ""
+
+            event_msg = f"💀 {survivor['name']} a été éliminé dans {killer_room} !"
+            game["events"].append({"message": event_msg, "type": "elimination"})
+            queue_event(turn_events, event_msg)
+            
+            # Send elimination popup to ALL players with dramatic effect
+            elimination_message = f"{killer['name']} a tué {survivor['name']} dans {killer_room}"
+            await broadcast_to_session(session_id, {
+                "type": "killer_elimination_popup",
+                "killer_name": killer['name'],
+                "survivor_name": survivor['name'],
+                "room_name": killer_room,
+                "survivor_class": survivor_class,
+                "death_image": death_image_path,
+                "message": elimination_message
+            })
 
-                # If survivor had medikit, destroy it and respawn a new one
-                if survivor["has_medikit"]:
-                    survivor["has_medikit"] = False
-                    new_medikit_room = respawn_medikit(game)
-                    if new_medikit_room:
-                        respawn_msg = "⚗️ La potion de résurrection réapparaît quelque part dans la maison..."
-                        game["events"].append({"message": respawn_msg, "type": "medikit_respawn"})
-                        await broadcast_to_session(session_id, {"type": "event", "message": respawn_msg})
+            # If survivor had medikit, destroy it and respawn a new one
+            if survivor["has_medikit"]:
+                survivor["has_medikit"] = False
+                new_medikit_room = respawn_medikit(game)
+                if new_medikit_room:
+                    respawn_msg = "⚗️ La potion de résurrection réapparaît quelque part dans la maison..."
+                    game["events"].append({"message": respawn_msg, "type": "medikit_respawn"})
+                    queue_event(turn_events, respawn_msg)
         
         # Check if this killer has rage power and found a survivor
-        if found_survivor and "rage" in game.get("active_powers", {}):
-            rage_data = game["active_powers"]["rage"]["data"].get(killer_id)
+        if found_survivor:
+            rage_data = rage_data_by_killer.get(killer_id)
             if rage_data and not rage_data.get("used_second_chance", False):
                 # Grant second chance to this killer
                 killers_with_rage_second_chance[killer_id] = True
                 rage_data["has_second_chance"] = True
                 
                 # Notify killer they get a second chance
-                if killer_id in active_connections.get(session_id, {}):
-                    try:
-                        await active_connections[session_id][killer_id].send_json({
-                            "type": "rage_second_chance",
-                            "message": "😡 Rage activé ! Vous pouvez fouiller une seconde pièce !"
-                        })
-                    except:
-                        pass
+                send_to_player(session_id, killer_id, {
+                    "type": "rage_second_chance",
+                    "message": "😡 Rage activé ! Vous pouvez fouiller une seconde pièce !"
+                })
 
     # Lock rooms where eliminations occurred
-    for room_name in set(eliminated_rooms):
+    for room_name in eliminated_rooms:
         game["rooms"][room_name]["locked"] = True
         event_msg = f"⚠️ La pièce {room_name} est condamnée pour ce tour."
         game["events"].append({"message": event_msg, "type": "room_locked"})
-        await broadcast_to_session(session_id, {"type": "event", "message": event_msg})
+        queue_event(turn_events, event_msg)
     
     # Check if any killers with rage have second chances
     if killers_with_rage_second_chance:
         # Set up the rage second selection phase
-        game["rage_second_chances"] = {}
+        game["rage_second_chances"].clear()
         for killer_id in killers_with_rage_second_chance.keys():
             game["rage_second_chances"][killer_id] = {
                 "can_select": True,
@@ -947,6 +1237,7 @@ async def process_turn(session_id: str):
         
         # Change phase to rage second selection
         game["phase"] = "rage_second_selection"
+        await flush_events(session_id, turn_events)
         await broadcast_to_session(session_id, {
             "type": "phase_change",
             "phase": "rage_second_selection",
@@ -955,8 +1246,8 @@ async def process_turn(session_id: str):
         return  # Exit early, will continue after second room selections
     
     # Apply Secousse power: relocate key if not found this turn
-    if not key_found_this_turn and "secousse" in game.get("active_powers", {}):
-        if game["active_powers"]["secousse"]["data"].get("should_relocate_key", False):
+    if not key_found_this_turn and "secousse" in active_powers:
+        if active_powers["secousse"]["data"].get("should_relocate_key", False):
             # Find current key location and remove it
             current_key_room = None
             for room_name, room_data in game["rooms"].items():
@@ -971,162 +1262,20 @@ async def process_turn(session_id: str):
                 if new_key_room:
                     event_msg = "↩️ La clef s'est déplacée vers une nouvelle pièce !"
                     game["events"].append({"message": event_msg, "type": "key_relocated"})
-                    await broadcast_to_session(session_id, {"type": "event", "message": event_msg})
-
-    # Check victory conditions
-    alive_survivors = [p for p in game["players"].values() if p["role"] == "survivor" and not p["eliminated"]]
-
-    # Check if all quests completed but crystal not spawned yet
-    if len(game["completed_quests"]) >= len(game["quests"]) and len(alive_survivors) > 0 and not game["crystal_spawned"]:
-        # Spawn the crystal for final quest
-        crystal_room = place_crystal(game)
-        if crystal_room:
-            # Send different messages based on role with crystal spawn video
-            survivor_msg = "💎 Le cristal est apparu : détruisez-le pour vous échapper d'ici !"
-            killer_msg = "💎 Le cristal est apparu : Empêchez-les de le détruire !"
-
-            game["events"].append({"message": survivor_msg, "type": "crystal_spawned", "for_role": "survivor"})
-            game["events"].append({"message": killer_msg, "type": "crystal_spawned", "for_role": "killer"})
-
-            # Send crystal spawn video to survivors
-            await broadcast_to_session(session_id, {
-                "type": "crystal_spawned",
-                "message": survivor_msg,
-                "video_path": "/event/Cristal_spawn.mp4"
-            }, role_filter="survivor")
-            
-            # Send crystal spawn video to killers
-            await broadcast_to_session(session_id, {
-                "type": "crystal_spawned",
-                "message": killer_msg,
-                "video_path": "/event/Cristal_spawn.mp4"
-            }, role_filter="killer")
-    
-    # Victory for survivors: crystal destroyed
-    if game.get("crystal_destroyed", False) and len(alive_survivors) > 0:
-        game["phase"] = "game_over"
-        game["winner"] = "survivors"
-        # Victory messages already sent when crystal was destroyed
-        return  # Exit early, game is over
+                    queue_event(turn_events, event_msg)
 
-    # Victory for killers: all survivors eliminated
-    if len(alive_survivors) == 0:
-        game["phase"] = "game_over"
-        game["winner"] = "killers"
-
-        # Send different messages based on role
-        survivor_msg = "🎉 DEFAITE ! Tous les survivants ont été éliminés..."
-        killer_msg = "💀 VICTOIRE ! Tous les survivants ont été éliminés ..."
-
-        game["events"].append({"message": survivor_msg, "type": "game_over", "for_role": "survivor"})
-        game["events"].append({"message": killer_msg, "type": "game_over", "for_role": "killer"})
-
-        # Send to survivors
-        await broadcast_to_session(session_id, {"type": "game_over", "winner": "killers", "message": survivor_msg}, role_filter="survivor")
-        # Send to killers
-        await broadcast_to_session(session_id, {"type": "game_over", "winner": "killers", "message": killer_msg}, role_filter="killer")
-        return  # Exit early, game is over
-
-    # Game continues - Handle toxine countdowns before next turn
-    # Decrement room poison durations
-    for room_name, room_data in game["rooms"].items():
-        if room_data.get("poisoned_turns_remaining", 0) > 0:
-            room_data["poisoned_turns_remaining"] -= 1
-    
-    # NOTE: Mimics are NOT cleared here anymore!
-    # Like traps, they need to persist until AFTER survivors make their selection in the next turn
-    # Mimics will be cleared in the survivor_selection phase after all survivors have selected
-    
-    # Decrement player poison countdowns and check for elimination
-    players_to_eliminate = []
-    for player_id, player in game["players"].items():
-        if player["role"] == "survivor" and not player["eliminated"]:
-            poison_countdown = player.get("poisoned_countdown", 0)
-            if poison_countdown > 0:
-                player["poisoned_countdown"] -= 1
-                
-                # Check if player suffocates
-                if player["poisoned_countdown"] == 0:
-                    players_to_eliminate.append(player_id)
-                else:
-                    # Send notification to poisoned survivor about remaining turns
-                    if player_id in active_connections.get(session_id, {}):
-                        try:
-                            await active_connections[session_id][player_id].send_json({
-                                "type": "poison_countdown",
-                                "countdown": player["poisoned_countdown"],
-                                "message": f"😷 Vous êtes empoisonné ! Il vous reste {player['poisoned_countdown']} tour(s) avant de suffoquer."
-                            })
-                        except:
-                            pass
-    
-    # Eliminate poisoned players
-    for player_id in players_to_eliminate:
-        player = game["players"][player_id]
-        player["eliminated"] = True
-        player["poisoned_countdown"] = 0
-        player["gold"] = 0  # Reset gold when eliminated
-        
-        event_msg = f"💀 {player['name']} a succombé au poison toxique !"
-        game["events"].append({"message": event_msg, "type": "player_eliminated"})
-        
-        # Get player class from avatar to determine death video
-        player_class = get_avatar_class(player.get("avatar", ""))
-        video_path = ""
-        if player_class:
-            # Format: /death/ClassName_toxine.mp4
-            video_path = f"/death/{player_class}_toxine.mp4"
-        
-        # Send toxin death popup to all players with video
-        toxin_death_msg = f"{player['name']} a succombé de la toxine !"
-        await broadcast_to_session(session_id, {
-            "type": "toxin_death_popup",
-            "message": toxin_death_msg,
-            "video_path": video_path,
-            "player_name": player['name']
-        })
-    
-    # Check if all survivors died from toxin (after toxin eliminations)
-    alive_survivors_after_toxin = [p for p in game["players"].values() if p["role"] == "survivor" and not p["eliminated"]]
-    
-    if len(alive_survivors_after_toxin) == 0:
-        # Wait for death videos to play (5 seconds) before sending game over messages
-        if len(players_to_eliminate) > 0:
-            await asyncio.sleep(5)
-        
-        game["phase"] = "game_over"
-        game["winner"] = "killers"
-        
-        # Send different messages based on role
-        survivor_msg = "🎉 DEFAITE ! Tous les survivants ont été éliminés..."
-        killer_msg = "💀 VICTOIRE ! Tous les survivants ont été éliminés ..."
-        
-        game["events"].append({"message": survivor_msg, "type": "game_over", "for_role": "survivor"})
-        game["events"].append({"message": killer_msg, "type": "game_over", "for_role": "killer"})
-        
-        # Send to survivors
-        await broadcast_to_session(session_id, {"type": "game_over", "winner": "killers", "message": survivor_msg}, role_filter="survivor")
-        # Send to killers
-        await broadcast_to_session(session_id, {"type": "game_over", "winner": "killers", "message": killer_msg}, role_filter="killer")
-        return  # Exit early, game is over
-    
-    # Next turn - Start with survivors selection
-    game["turn"] += 1
-    game["phase"] = "survivor_selection"
-    game["pending_actions"] = {}
-    # Clear active powers
-    game["active_powers"] = {}
-    game["pending_power_selections"] = {}
-    await broadcast_to_session(session_id, {
-        "type": "new_turn",
-        "turn": game["turn"],
-        "phase": "survivor_selection",
-        "message": f"🔄 Tour {game['turn']} - Les survivants sélectionnent leur pièce"
-    })
+    await finish_turn(session_id, turn_events)
 
 async def process_rage_second_selections(session_id: str):
     """Process second room selections for killers with rage power"""
     game = game_sessions[session_id]
+    # Plain events are sent as one turn_events frame (see process_turn)
+    turn_events = []
+    
+    # Alive survivors by room (a room is emptied by the first killer searching it)
+    survivors_by_room = {}
+    for survivor_id in game["_alive_survivor_ids"]:
+        survivors_by_room.setdefault(game["players"][survivor_id]["current_room"], []).append(survivor_id)
     
     # Get all second room selections
     for killer_id, rage_data in game["rage_second_chances"].items():
@@ -1141,61 +1290,68 @@ async def process_rage_second_selections(session_id: str):
         
         # Check for eliminations in second room
         eliminated_in_second_room = []
-        for survivor_id, survivor in game["players"].items():
-            if (survivor["role"] == "survivor" and
-                not survivor["eliminated"] and
-                survivor["current_room"] == second_room):
-                
-                # Eliminate the survivor
-                survivor["eliminated"] = True
-                survivor["gold"] = 0  # Reset gold when eliminated
-                game["rooms"][second_room]["eliminated_players"].append(survivor_id)
-                eliminated_in_second_room.append(survivor_id)
-                
-                # Get survivor class for death image
-                survivor_class = survivor.get("character_class", "")
-                death_image_path = f"/death/{survivor_class}.png" if survivor_class else ""
-                
-                event_msg = f"💀😡 {survivor['name']} a été éliminé dans {second_room} (Rage) !"
-                game["events"].append({"message": event_msg, "type": "elimination"})
-                await broadcast_to_session(session_id, {"type": "event", "message": event_msg})
-                
-                # Send elimination popup to ALL players with dramatic effect
-                elimination_message = f"{killer['name']} a tué {survivor['name']} dans {second_room}"
-                await broadcast_to_session(session_id, {
-                    "type": "killer_elimination_popup",
-                    "killer_name": killer['name'],
-                    "survivor_name": survivor['name'],
-                    "room_name": second_room,
-                    "survivor_class": survivor_class,
-                    "death_image": death_image_path,
-                    "message": elimination_message
-                })
-                
-                # If survivor had medikit, destroy it and respawn a new one
-                if survivor["has_medikit"]:
-                    survivor["has_medikit"] = False
-                    new_medikit_room = respawn_medikit(game)
-                    if new_medikit_room:
-                        respawn_msg = "⚗️ La potion de résurrection réapparaît quelque part dans la maison..."
-                        game["events"].append({"message": respawn_msg, "type": "medikit_respawn"})
-                        await broadcast_to_session(session_id, {"type": "event", "message": respawn_msg})
+        for survivor_id in survivors_by_room.pop(second_room, ()):
+            survivor = game["players"][survivor_id]
+            
+            # Eliminate the survivor
+            set_player_eliminated(game, survivor_id, True)
+            survivor["gold"] = 0  # Reset gold when eliminated
+            game["rooms"][second_room]["eliminated_players"].append(survivor_id)
+            eliminated_in_second_room.append(survivor_id)
+            
+            # Get survivor class for death image
+            survivor_class = survivor.get("character_class", "")
+            death_image_path = f"/death/{survivor_class}.png" if survivor_class else ""
+            
+            event_msg = f"💀😡 {survivor['name']} a été éliminé dans {second_room} (Rage) !"
+            game["events"].append({"message": event_msg, "type": "elimination"})
+            queue_event(turn_events, event_msg)
+            
+            # Send elimination popup to ALL players with dramatic effect
+            elimination_message = f"{killer['name']} a tué {survivor['name']} dans {second_room}"
+            await broadcast_to_session(session_id, {
+                "type": "killer_elimination_popup",
+                "killer_name": killer['name'],
+                "survivor_name": survivor['name'],
+                "room_name": second_room,
+                "survivor_class": survivor_class,
+                "death_image": death_image_path,
+                "message": elimination_message
+            })
+            
+            # If survivor had medikit, destroy it and respawn a new one
+            if survivor["has_medikit"]:
+                survivor["has_medikit"] = False
+                new_medikit_room = respawn_medikit(game)
+                if new_medikit_room:
+                    respawn_msg = "⚗️ La potion de résurrection réapparaît quelque part dans la maison..."
+                    game["events"].append({"message": respawn_msg, "type": "medikit_respawn"})
+                    queue_event(turn_events, respawn_msg)
         
         # Lock second room if eliminations occurred
         if eliminated_in_second_room:
             game["rooms"][second_room]["locked"] = True
             event_msg = f"⚠️ La pièce {second_room} est condamnée pour ce tour."
             game["events"].append({"message": event_msg, "type": "room_locked"})
-            await broadcast_to_session(session_id, {"type": "event", "message": event_msg})
+            queue_event(turn_events, event_msg)
     
     # Clear rage second chances
-    game["rage_second_chances"] = {}
-    
-    # Check victory conditions again
-    alive_survivors = [p for p in game["players"].values() if p["role"] == "survivor" and not p["eliminated"]]
+    game["rage_second_chances"].clear()
     
+    await finish_turn(session_id, turn_events)
+
+async def finish_turn(session_id: str, turn_events: list):
+    """
+    End of a turn, shared by process_turn and process_rage_second_selections:
+    crystal spawn, victory checks, toxin countdowns, then the next turn
+    """
+    game = game_sessions[session_id]
+
+    # Check victory conditions
+    alive_survivors = game["_alive_survivor_ids"]
+
     # Check if all quests completed but crystal not spawned yet
-    if len(game["completed_quests"]) >= len(game["quests"]) and len(alive_survivors) > 0 and not game["crystal_spawned"]:
+    if game["keys_collected"] >= len(game["quests"]) and len(alive_survivors) > 0 and not game["crystal_spawned"]:
         # Spawn the crystal for final quest
         crystal_room = place_crystal(game)
         if crystal_room:
@@ -1225,26 +1381,17 @@ async def process_rage_second_selections(session_id: str):
         game["phase"] = "game_over"
         game["winner"] = "survivors"
         # Victory messages already sent when crystal was destroyed
+        await flush_events(session_id, turn_events)
         return  # Exit early, game is over
-    
+
     # Victory for killers: all survivors eliminated
     if len(alive_survivors) == 0:
         game["phase"] = "game_over"
         game["winner"] = "killers"
-        
-        # Send different messages based on role
-        survivor_msg = "🎉 DEFAITE ! Tous les survivants ont été éliminés..."
-        killer_msg = "💀 VICTOIRE ! Tous les survivants ont été éliminés ..."
-        
-        game["events"].append({"message": survivor_msg, "type": "game_over", "for_role": "survivor"})
-        game["events"].append({"message": killer_msg, "type": "game_over", "for_role": "killer"})
-        
-        # Send to survivors
-        await broadcast_to_session(session_id, {"type": "game_over", "winner": "killers", "message": survivor_msg}, role_filter="survivor")
-        # Send to killers
-        await broadcast_to_session(session_id, {"type": "game_over", "winner": "killers", "message": killer_msg}, role_filter="killer")
+        await flush_events(session_id, turn_events)
+        await announce_game_over(session_id, "killers")
         return  # Exit early, game is over
-    
+
     # Game continues - Handle toxine countdowns before next turn
     # Decrement room poison durations
     for room_name, room_data in game["rooms"].items():
@@ -1257,39 +1404,35 @@ async def process_rage_second_selections(session_id: str):
     
     # Decrement player poison countdowns and check for elimination
     players_to_eliminate = []
-    for player_id, player in game["players"].items():
-        if player["role"] == "survivor" and not player["eliminated"]:
-            poison_countdown = player.get("poisoned_countdown", 0)
-            if poison_countdown > 0:
-                player["poisoned_countdown"] -= 1
+    for player_id in game["_alive_survivor_ids"]:
+        player = game["players"][player_id]
+        poison_countdown = player.get("poisoned_countdown", 0)
+        if poison_countdown > 0:
+            player["poisoned_countdown"] -= 1
                 
-                # Check if player suffocates
-                if player["poisoned_countdown"] == 0:
-                    players_to_eliminate.append(player_id)
-                else:
-                    # Send notification to poisoned survivor about remaining turns
-                    if player_id in active_connections.get(session_id, {}):
-                        try:
-                            await active_connections[session_id][player_id].send_json({
-                                "type": "poison_countdown",
-                                "countdown": player["poisoned_countdown"],
-                                "message": f"😷 Vous êtes empoisonné ! Il vous reste {player['poisoned_countdown']} tour(s) avant de suffoquer."
-                            })
-                        except:
-                            pass
+            # Check if player suffocates
+            if player["poisoned_countdown"] == 0:
+                players_to_eliminate.append(player_id)
+            else:
+                # Send notification to poisoned survivor about remaining turns
+                send_to_player(session_id, player_id, {
+                    "type": "poison_countdown",
+                    "countdown": player["poisoned_countdown"],
+                    "message": f"😷 Vous êtes empoisonné ! Il vous reste {player['poisoned_countdown']} tour(s) avant de suffoquer."
+                })
     
     # Eliminate poisoned players
     for player_id in players_to_eliminate:
         player = game["players"][player_id]
-        player["eliminated"] = True
+        set_player_eliminated(game, player_id, True)
         player["poisoned_countdown"] = 0
         player["gold"] = 0  # Reset gold when eliminated
         
         event_msg = f"💀 {player['name']} a succombé au poison toxique !"
         game["events"].append({"message": event_msg, "type": "player_eliminated"})
         
-        # Get player class from avatar to determine death video
-        player_class = get_avatar_class(player.get("avatar", ""))
+        # The player's class (set together with the avatar) determines the death video
+        player_class = player.get("character_class")
         video_path = ""
         if player_class:
             # Format: /death/ClassName_toxine.mp4
@@ -1305,36 +1448,31 @@ async def process_rage_second_selections(session_id: str):
         })
     
     # Check if all survivors died from toxin (after toxin eliminations)
-    alive_survivors_after_toxin = [p for p in game["players"].values() if p["role"] == "survivor" and not p["eliminated"]]
+    alive_survivors_after_toxin = game["_alive_survivor_ids"]
     
     if len(alive_survivors_after_toxin) == 0:
-        # Wait for death videos to play (5 seconds) before sending game over messages
+        await flush_events(session_id, turn_events)
+
+        # Let the death videos play (5 seconds) before sending game over messages,
+        # without holding up the handler that triggered the turn
         if len(players_to_eliminate) > 0:
-            await asyncio.sleep(5)
+            game["_game_over_task"] = asyncio.create_task(end_game_later(session_id, "killers", TOXIN_DEATH_VIDEO_DELAY))
+            return
         
         game["phase"] = "game_over"
         game["winner"] = "killers"
         
-        # Send different messages based on role
-        survivor_msg = "🎉 DEFAITE ! Tous les survivants ont été éliminés..."
-        killer_msg = "💀 VICTOIRE ! Tous les survivants ont été éliminés ..."
-        
-        game["events"].append({"message": survivor_msg, "type": "game_over", "for_role": "survivor"})
-        game["events"].append({"message": killer_msg, "type": "game_over", "for_role": "killer"})
-        
-        # Send to survivors
-        await broadcast_to_session(session_id, {"type": "game_over", "winner": "killers", "message": survivor_msg}, role_filter="survivor")
-        # Send to killers
-        await broadcast_to_session(session_id, {"type": "game_over", "winner": "killers", "message": killer_msg}, role_filter="killer")
+        await announce_game_over(session_id, "killers")
         return  # Exit early, game is over
     
     # Next turn - Start with survivors selection
     game["turn"] += 1
     game["phase"] = "survivor_selection"
-    game["pending_actions"] = {}
+    game["pending_actions"].clear()
     # Clear active powers
-    game["active_powers"] = {}
-    game["pending_power_selections"] = {}
+    game["active_powers"].clear()
+    game["pending_power_selections"].clear()
+    await flush_events(session_id, turn_events)
     await broadcast_to_session(session_id, {
         "type": "new_turn",
         "turn": game["turn"],
@@ -1367,16 +1505,10 @@ async def create_game(request: CreateGameRequest):
 async def join_game(session_id: str, request: JoinGameRequest):
     """Join an existing game session"""
     # MODIFIED: Accept case-insensitive session_id
-    session_id_upper = session_id.upper()
+    # Session codes are generated in uppercase, so normalizing the input is enough
+    matching_session = session_id.upper()
     
-    # Find the matching session (case-insensitive)
-    matching_session = None
-    for sid in game_sessions.keys():
-        if sid.upper() == session_id_upper:
-            matching_session = sid
-            break
-    
-    if not matching_session:
+    if matching_session not in game_sessions:
         raise HTTPException(status_code=404, detail="Session not found")
 
     game = game_sessions[matching_session]
@@ -1414,10 +1546,7 @@ async def join_game(session_id: str, request: JoinGameRequest):
     })
     
     # FIXED: Also broadcast complete state update to ensure all players see the new player
-    await broadcast_to_session(matching_session, {
-        "type": "state_update",
-        "game": game
-    })
+    mark_state_dirty(matching_session)
 
     return {
         "session_id": matching_session,
@@ -1427,83 +1556,70 @@ async def join_game(session_id: str, request: JoinGameRequest):
 @api_router.post("/game/{session_id}/start")
 async def start_game(session_id: str):
     """Start the game"""
-    logger.info(f"Attempting to start game: {session_id}")
+    logger.info("Attempting to start game: %s", session_id)
 
     if session_id not in game_sessions:
-        logger.error(f"Session not found: {session_id}")
+        logger.error("Session not found: %s", session_id)
         raise HTTPException(status_code=404, detail="Session not found")
 
     game = game_sessions[session_id]
-    logger.info(f"Game state: game_started={game['game_started']}, players={len(game['players'])}")
+    logger.info("Game state: game_started=%s, players=%s", game['game_started'], len(game['players']))
 
     if game["game_started"]:
-        logger.error(f"Game already started: {session_id}")
+        logger.error("Game already started: %s", session_id)
         raise HTTPException(status_code=400, detail="Game already started")
 
     # NEW: Handle conspiracy mode - randomly assign roles AND classes
     if game.get("conspiracy_mode", False):
         player_count = len(game["players"])
         
-        # Define role distribution based on player count
-        role_distribution = {
-            3: {"survivors": 2, "killers": 1},
-            4: {"survivors": 2, "killers": 2},
-            5: {"survivors": 3, "killers": 2},
-            6: {"survivors": 4, "killers": 2},
-            7: {"survivors": 4, "killers": 3},
-            8: {"survivors": 5, "killers": 3}
-        }
-        
-        # Get the distribution for current player count
-        distribution = role_distribution.get(player_count, {"survivors": max(1, player_count - 1), "killers": 1})
+        # Get the survivor count for current player count (only the fallback is computed)
+        distribution = CONSPIRACY_ROLE_DISTRIBUTION.get(player_count)
+        survivor_count = distribution["survivors"] if distribution else max(1, player_count - 1)
         
-        # Get all player IDs and shuffle them
-        player_ids = list(game["players"].keys())
-        random.shuffle(player_ids)
+        # Draw the survivors at random: everyone else becomes a killer
+        survivor_ids = random.sample(list(game["players"]), survivor_count)
         
-        # Shuffle available avatars for unique assignment
-        available_survivor_avatars = SURVIVOR_AVATARS.copy()
-        random.shuffle(available_survivor_avatars)
+        # Draw distinct avatars for unique assignment
+        available_survivor_avatars = random.sample(SURVIVOR_AVATARS, min(survivor_count, len(SURVIVOR_AVATARS)))
         
-        available_killer_avatars = KILLER_AVATARS.copy()
-        
-        survivor_index = 0
-        killer_index = 0
+        # Assign survivor roles AND unique classes
+        for survivor_index, player_id in enumerate(survivor_ids):
+            player = game["players"][player_id]
+            player["role"] = "survivor"
+            
+            if survivor_index < len(available_survivor_avatars):
+                avatar_data = available_survivor_avatars[survivor_index]
+                player["avatar"] = avatar_data["path"]
+                player["character_class"] = avatar_data["class"]
+                logger.info("Assigned survivor class %s to player %s", avatar_data['class'], player['name'])
         
-        # Assign roles AND unique classes
-        for i, player_id in enumerate(player_ids):
-            if i < distribution["survivors"]:
-                # Assign survivor role
-                game["players"][player_id]["role"] = "survivor"
-                
-                # Assign unique survivor avatar and class
-                if survivor_index < len(available_survivor_avatars):
-                    avatar_data = available_survivor_avatars[survivor_index]
-                    game["players"][player_id]["avatar"] = avatar_data["path"]
-                    game["players"][player_id]["character_class"] = avatar_data["class"]
-                    survivor_index += 1
-                    logger.info(f"Assigned survivor class {avatar_data['class']} to player {game['players'][player_id]['name']}")
-            else:
-                # Assign killer role
-                game["players"][player_id]["role"] = "killer"
-                
-                # Assign killer avatar (can be duplicate)
-                avatar_data = random.choice(available_killer_avatars)
-                game["players"][player_id]["avatar"] = avatar_data["path"]
-                game["players"][player_id]["character_class"] = avatar_data["class"]
-                killer_index += 1
-                logger.info(f"Assigned killer class {avatar_data['class']} to player {game['players'][player_id]['name']}")
+        # Assign killer roles (avatar can be duplicate)
+        survivor_id_set = set(survivor_ids)
+        for player_id, player in game["players"].items():
+            if player_id in survivor_id_set:
+                continue
+            player["role"] = "killer"
+            
+            avatar_data = random.choice(KILLER_AVATARS)
+            player["avatar"] = avatar_data["path"]
+            player["character_class"] = avatar_data["class"]
+            logger.info("Assigned killer class %s to player %s", avatar_data['class'], player['name'])
         
-        logger.info(f"Conspiracy mode: Assigned {distribution['survivors']} survivors and {distribution['killers']} killers with unique survivor classes")
+        logger.info("Conspiracy mode: Assigned %s survivors and %s killers with unique survivor classes", survivor_count, player_count - survivor_count)
+
+    # Roles are final from here on: index players by role
+    index_player_roles(game)
+    sync_connection_roles(session_id)
 
     # Validate game can start (after role assignment in conspiracy mode)
     is_valid, error_message = validate_game_start(game)
     if not is_valid:
-        logger.warning(f"Game start validation failed: {error_message}")
+        logger.warning("Game start validation failed: %s", error_message)
         raise HTTPException(status_code=400, detail=error_message)
 
     # Count survivors (only survivors need to complete quests)
-    survivors = [p for p in game["players"].values() if p["role"] == "survivor"]
+    survivors = [game["players"][pid] for pid in game["_survivor_ids"]]
     game["keys_needed"] = len(survivors)  # Keep for compatibility with frontend display
     game["game_started"] = True
     game["phase"] = "survivor_selection"  # Start with survivors
@@ -1511,12 +1627,13 @@ async def start_game(session_id: str):
 
     # Generate quests for all survivors
     game["quests"] = generate_quests(survivors)
-    logger.info(f"Generated {len(game['quests'])} quests: {[q['class'] for q in game['quests']]}")
+    logger.info("Generated %s quests: %s", len(game['quests']), [q['class'] for q in game['quests']])
 
     # Place the FIRST quest at game start
+    killer_positions = get_killer_positions(game)
     if game["quests"]:
         first_quest = game["quests"][0]
-        first_quest_room = place_quest(game, first_quest["class"])
+        first_quest_room = place_quest(game, first_quest["class"], killer_positions)
         if first_quest_room:
             game["active_quest"] = {
                 "class": first_quest["class"],
@@ -1524,11 +1641,11 @@ async def start_game(session_id: str):
                 "player_id": first_quest["player_id"],
                 "player_name": first_quest["player_name"]
             }
-            logger.info(f"First quest placed for {first_quest['class']} in: {first_quest_room}")
+            logger.info("First quest placed for %s in: %s", first_quest['class'], first_quest_room)
 
     # Place the FIRST medikit at game start
-    medikit_room = respawn_medikit(game)
-    logger.info(f"First medikit placed in: {medikit_room}")
+    medikit_room = respawn_medikit(game, killer_positions)
+    logger.info("First medikit placed in: %s", medikit_room)
 
     await broadcast_to_session(session_id, {
         "type": "game_started",
@@ -1552,7 +1669,7 @@ async def get_game_state(session_id: str, player_id: Optional[str] = None):
         player_role = game["players"][player_id]["role"]
         return filter_game_state(game, player_role)
 
-    return game
+    return public_game_state(game)
 
 @api_router.get("/powers")
 async def get_powers():
@@ -1577,22 +1694,14 @@ async def reset_game(session_id: str):
         player["gold"] = 0  # NEW: reset gold
     
     # Reset rooms
-    for room_name, room_data in game["rooms"].items():
-        room_data["has_key"] = False
-        room_data["has_medikit"] = False
-        room_data["locked"] = False
-        room_data["eliminated_players"] = []
-        room_data["trapped"] = False  # NEW: reset traps
-        room_data["highlighted"] = False  # NEW: reset highlights
+    for room_data in game["rooms"].values():
+        room_data.update(ROOM_TEMPLATE, eliminated_players=[])  # fresh list per room
         room_data.pop("trap_triggered", None)  # NEW: remove trap_triggered
-        room_data["poisoned_turns_remaining"] = 0  # NEW: reset poison
-        room_data["has_mimic"] = False  # NEW: reset mimics
-        room_data["has_quest"] = False  # NEW: reset quests
-        room_data["quest_class"] = None  # NEW: reset quest class
-        room_data["has_crystal"] = False  # NEW: reset crystal
-        room_data["teleportation_trap"] = False  # NEW: reset teleportation trap
-        room_data["teleportation_exit"] = False  # NEW: reset teleportation exit
-        room_data["teleportation_target_room"] = None  # NEW: reset teleportation target
+    
+    # A delayed game over from the previous game must not land on the new one
+    if game["_game_over_task"]:
+        game["_game_over_task"].cancel()
+        game["_game_over_task"] = None
     
     # Reset game state
     game["keys_collected"] = 0
@@ -1600,19 +1709,19 @@ async def reset_game(session_id: str):
     game["game_started"] = False
     game["turn"] = 0
     game["phase"] = "waiting"
-    game["events"] = []
-    game["pending_actions"] = {}
+    game["events"].clear()
+    game["pending_actions"].clear()
     game["should_place_next_key"] = False
-    game["quests"] = []  # NEW: reset quests
+    game["quests"].clear()  # NEW: reset quests
     game["active_quest"] = None  # NEW: reset active quest
-    game["completed_quests"] = []  # NEW: reset completed quests
-    game["active_powers"] = {}  # NEW: reset powers
-    game["pending_power_selections"] = {}  # NEW: reset power selections
-    game["rooms_searched_this_key"] = []  # NEW: reset searched rooms
+    game["completed_quests"].clear()  # NEW: reset completed quests
+    game["active_powers"].clear()  # NEW: reset powers
+    game["pending_power_selections"].clear()  # NEW: reset power selections
+    game["_rooms_searched_this_key"].clear()  # NEW: reset searched rooms
     game["crystal_spawned"] = False  # NEW: reset crystal spawned
     game["crystal_destroyed"] = False  # NEW: reset crystal destroyed
     
-    logger.info(f"Game reset for session: {session_id}")
+    logger.info("Game reset for session: %s", session_id)
     
     # Broadcast game reset to all players
     await broadcast_to_session(session_id, {
@@ -1621,10 +1730,7 @@ async def reset_game(session_id: str):
     })
     
     # Send updated state to all players so they see the correct lobby state
-    await broadcast_to_session(session_id, {
-        "type": "state_update",
-        "game": game
-    })
+    mark_state_dirty(session_id)
     
     return {"status": "reset"}
 
@@ -1647,8 +1753,9 @@ async def change_role(session_id: str, player_id: str, new_role: str):
     
     # Change the player's role
     game["players"][player_id]["role"] = new_role
+    sync_connection_roles(session_id)
     
-    logger.info(f"Player {player_id} changed role to {new_role} in session {session_id}")
+    logger.info("Player %s changed role to %s in session %s", player_id, new_role, session_id)
     
     # Broadcast role change to all players
     await broadcast_to_session(session_id, {
@@ -1689,8 +1796,9 @@ async def update_player(session_id: str, request: JoinGameRequest, player_id: st
     game["players"][player_id]["character_class"] = character_class
     game["players"][player_id]["role"] = request.role
     game["players"][player_id]["is_host"] = is_host  # Preserve host status
+    sync_connection_roles(session_id)
     
-    logger.info(f"Player {player_id} updated profile in session {session_id}, is_host={is_host}")
+    logger.info("Player %s updated profile in session %s, is_host=%s", player_id, session_id, is_host)
     
     # Broadcast player update to all players
     await broadcast_to_session(session_id, {
@@ -1699,10 +1807,7 @@ async def update_player(session_id: str, request: JoinGameRequest, player_id: st
     })
     
     # FIXED: Also broadcast complete state update to ensure all players see the updated state
-    await broadcast_to_session(session_id, {
-        "type": "state_update",
-        "game": game
-    })
+    mark_state_dirty(session_id)
     
     return {"status": "success", "player_id": player_id}
 
@@ -1716,39 +1821,18 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
         await websocket.close(code=1008)
         return
 
-    if session_id not in active_connections:
-        active_connections[session_id] = {}
-
-    active_connections[session_id][player_id] = websocket
+    connection = open_connection(session_id, player_id, websocket)
 
     try:
-        # Send current game state (filtered by player role only during active game)
+        # Send current game state (filtered by player role only during active game).
+        # It goes through the coalesced state broadcast: players (re)connecting together share
+        # one filtered and serialized state per role, and in lobby everyone sees the player list.
         game = game_sessions[session_id]
         if player_id in game["players"]:
-            # Only filter during active game, not in lobby
-            if game.get("game_started", False):
-                player_role = game["players"][player_id]["role"]
-                filtered_game = filter_game_state(game, player_role)
-                await websocket.send_json({
-                    "type": "state_update",
-                    "game": filtered_game
-                })
-            else:
-                # In lobby, send unfiltered state
-                await websocket.send_json({
-                    "type": "state_update",
-                    "game": game
-                })
-                
-                # FIXED: Notify all other connected players that someone reconnected
-                # This ensures everyone sees the complete player list when someone refreshes or reconnects
-                await broadcast_to_session(session_id, {
-                    "type": "state_update",
-                    "game": game
-                })
+            mark_state_dirty(session_id)
 
         while True:
-            data = await websocket.receive_json()
+            data = orjson.loads(await websocket.receive_text())
             game = game_sessions[session_id]
             player = game["players"][player_id]
 
@@ -1761,15 +1845,12 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                     
                     # If player tries to select a different room, block it
                     if room_name != current_room:
-                        await websocket.send_json({
+                        send_to_player(session_id, player_id, {
                             "type": "error",
                             "message": f"🥶 Vous êtes immobilisé par un blizzard ! Cliquez sur '{current_room}' pour passer votre tour."
                         })
                         # Broadcast updated state even on error so frontend stays responsive
-                        await broadcast_to_session(session_id, {
-                            "type": "state_update",
-                            "game": game_sessions[session_id]
-                        })
+                        mark_state_dirty(session_id)
                         continue
                     
                     # Player selected their current room - they pass their turn
@@ -1780,10 +1861,10 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                     }
                     
                     # LOG: Player room selection (immobilized case)
-                    logger.info(f"🎯 {player['name']}, {player['character_class']}, {player['role']} a choisi la pièce '{room_name}' (immobilisé)")
+                    logger.info("🎯 %s, %s, %s a choisi la pièce '%s' (immobilisé)", player['name'], player['character_class'], player['role'], room_name)
                     
                     # Notify the player they've passed their turn
-                    await websocket.send_json({
+                    send_to_player(session_id, player_id, {
                         "type": "turn_skipped",
                         "message": "🕸️ Vous passez votre tour car vous êtes immobilisé."
                     })
@@ -1792,18 +1873,13 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                     await broadcast_to_session(session_id, {
                         "type": "player_action",
                         "player_id": player_id,
-                        "player_name": game["players"][player_id]["name"],
+                        "player_name": player["name"],
                         "message": f"✅ {game['players'][player_id]['name']} a fait son choix"
                     })
                     
                     # Check if all survivors have selected
                     if game["phase"] == "survivor_selection":
-                        alive_survivors = [p for p in game["players"].values()\
-                                         if p["role"] == "survivor" and not p["eliminated"]]
-                        survivors_selected = [pid for pid in game["pending_actions"].keys()\
-                                            if game["players"][pid]["role"] == "survivor"]
-
-                        if len(survivors_selected) == len(alive_survivors):
+                        if game["_alive_survivor_ids"] <= game["pending_actions"].keys():
                             # All survivors have selected, NOW clear traps and mimics from previous turn
                             for room_name_clear, room_data in game["rooms"].items():
                                 room_data["trapped"] = False
@@ -1815,12 +1891,10 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                             
                             # Move to killer power selection
                             game["phase"] = "killer_power_selection"
-                            game["pending_power_selections"] = {}
+                            game["pending_power_selections"].clear()
                             
                             # Assign 3 random powers to each killer
-                            alive_killers = [p for p in game["players"].values() if p["role"] == "killer" and not p["eliminated"]]
-                            for killer in alive_killers:
-                                killer_id = killer["id"]
+                            for killer_id in game["_alive_killer_ids"]:
                                 power_options = get_random_powers()
                                 game["pending_power_selections"][killer_id] = {
                                     "options": power_options,
@@ -1836,10 +1910,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                             })
                     
                     # Broadcast updated state
-                    await broadcast_to_session(session_id, {
-                        "type": "state_update",
-                        "game": game_sessions[session_id]
-                    })
+                    mark_state_dirty(session_id)
                     continue
                 
                 # Check if it's the player's turn based on their role and current phase (AFTER immobilization check)
@@ -1859,7 +1930,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                         game["rage_second_chances"][player_id]["can_select"] = False
                         
                         # LOG: Rage second room selection
-                        logger.info(f"😡 {player['name']} a choisi la seconde pièce '{room_name}' (Rage)")
+                        logger.info("😡 %s a choisi la seconde pièce '%s' (Rage)", player['name'], room_name)
                         
                         # Check if all killers with rage have selected their second room
                         all_selected = all(not data["can_select"] for data in game["rage_second_chances"].values())
@@ -1870,13 +1941,11 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                             await process_rage_second_selections(session_id)
                         
                         # Broadcast updated state
-                        await broadcast_to_session(session_id, {
-                            "type": "state_update",
-                            "game": game_sessions[session_id]
-                        })
+                        mark_state_dirty(session_id)
                         continue
                 
-                if room_name in game["rooms"] and not game["rooms"][room_name]["locked"]:
+                room = game["rooms"].get(room_name)
+                if room and not room["locked"]:
                     game["pending_actions"][player_id] = {
                         "action": "select_room",
                         "room": room_name
@@ -1884,7 +1953,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                     
                     # LOG: Player room selection
                     original_room_name = room_name
-                    logger.info(f"🎯 {player['name']}, {player['character_class']}, {player['role']} a choisi la pièce '{room_name}'")
+                    logger.info("🎯 %s, %s, %s a choisi la pièce '%s'", player['name'], player['character_class'], player['role'], room_name)
 
                     # DISABLED: Sound clue functionality kept for Traque power
                     # The get_survivor_floor_hints() function can be used when Traque is activated
@@ -1895,9 +1964,9 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                     #     await broadcast_to_session(session_id, {"type": "event", "message": sound_event_msg}, role_filter="killer")
                     
                     # PRIORITY CHECK: Teleportation trap - must be checked BEFORE any other event
-                    if player["role"] == "survivor" and game["rooms"][room_name].get("teleportation_trap", False):
+                    if player["role"] == "survivor" and room.get("teleportation_trap", False):
                         # Survivor triggered teleportation trap!
-                        target_room = game["rooms"][room_name].get("teleportation_target_room")
+                        target_room = room.get("teleportation_target_room")
                         
                         if target_room and target_room in game["rooms"]:
                             # Get player class for video path
@@ -1905,7 +1974,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                             video_path = f"/death/{player_class}_teleportation.mp4"
                             
                             # Send teleportation notification to the survivor with video
-                            await websocket.send_json({
+                            send_to_player(session_id, player_id, {
                                 "type": "teleportation_notification",
                                 "message": f"Vous déclenchez un piège de téléportation vers {target_room} !",
                                 "video_path": video_path,
@@ -1915,40 +1984,39 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                             # Teleport player to target room - update their selected room
                             game["pending_actions"][player_id]["room"] = target_room
                             room_name = target_room  # Continue processing with the target room
+                            room = game["rooms"][target_room]
                             
-                            logger.info(f"🌀 {player['name']} téléporté de {original_room_name} vers {target_room}")
+                            logger.info("🌀 %s téléporté de %s vers %s", player['name'], original_room_name, target_room)
                     
                     # Track rooms searched for Vision power (track the final room after teleportation)
-                    if player["role"] == "survivor" and room_name not in game.get("rooms_searched_this_key", []):
-                        if "rooms_searched_this_key" not in game:
-                            game["rooms_searched_this_key"] = []
-                        game["rooms_searched_this_key"].append(room_name)
+                    if player["role"] == "survivor":
+                        game["_rooms_searched_this_key"].add(room_name)
                     
                     # Check if survivor enters trapped room
-                    if player["role"] == "survivor" and game["rooms"][room_name].get("trapped", False):
+                    if player["role"] == "survivor" and room.get("trapped", False):
                         player["immobilized_next_turn"] = True
                         # Mark room as trap triggered for survivors
-                        game["rooms"][room_name]["trap_triggered"] = True
+                        room["trap_triggered"] = True
                         
                         # Get player class for video path
                         player_class = player.get("character_class", "Mage").lower()
                         video_path = f"/death/Blizzard_{player_class}.mp4"
                         
                         # NEW: Send trap notification immediately to the survivor with video
-                        await websocket.send_json({
+                        send_to_player(session_id, player_id, {
                             "type": "trapped_notification",
                             "message": "🥶 C'est un blizzard ! Vous n'avez pas d'autre choix que de vous cacher ce tour-ci.",
                             "video_path": video_path
                         })
                     
                     # Check if survivor enters poisoned room
-                    if player["role"] == "survivor" and game["rooms"][room_name].get("poisoned_turns_remaining", 0) > 0:
+                    if player["role"] == "survivor" and room.get("poisoned_turns_remaining", 0) > 0:
                         # Only poison if not already poisoned
                         if player.get("poisoned_countdown", 0) == 0:
                             player["poisoned_countdown"] = 10
                             
                             # Send poisoned notification immediately to the survivor
-                            await websocket.send_json({
+                            send_to_player(session_id, player_id, {
                                 "type": "poisoned_notification",
                                 "message": "😷 Vous avez été empoisonné par un gaz toxique ! Il vous reste 10 tours avant de suffoquer.",
                                 "countdown": 10
@@ -1956,8 +2024,6 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                     
                     # Check for quest immediately when survivor selects room
                     if player["role"] == "survivor":
-                        room = game["rooms"][room_name]
-                        
                         if room.get("has_quest", False) and room.get("quest_class"):
                             quest_class = room["quest_class"]
                             player_class = player.get("character_class")
@@ -1967,34 +2033,31 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                                 room["has_quest"] = False
                                 room["quest_class"] = None
                                 game["completed_quests"].append(quest_class)
-                                game["keys_collected"] = len(game["completed_quests"])  # Update for frontend compatibility
+                                game["keys_collected"] += 1  # Counts completed_quests, kept for frontend compatibility
                                 
-                                quests_left = game["keys_needed"] - len(game["completed_quests"])
+                                quests_left = game["keys_needed"] - game["keys_collected"]
                                 event_msg = f"✅ {player['name']} a complété sa quête ! Il reste {quests_left} quête(s) à compléter."
                                 game["events"].append({"message": event_msg, "type": "quest_completed", "for_role": "survivor"})
                                 # Notify only survivors about quest completed
                                 await broadcast_to_session(session_id, {"type": "event", "message": event_msg}, role_filter="survivor")
                                 
                                 # Send video popup to the player who completed the quest
-                                try:
-                                    video_path = f"/event/{quest_class}.mp4"
-                                    await websocket.send_json({
-                                        "type": "quest_completed_popup",
-                                        "message": f"Vous avez complété votre quête ! Plus que {quests_left} quête(s) pour vous enfuir !",
-                                        "video_path": video_path,
-                                        "quests_left": quests_left
-                                    })
-                                except:
-                                    pass
+                                video_path = f"/event/{quest_class}.mp4"
+                                send_to_player(session_id, player_id, {
+                                    "type": "quest_completed_popup",
+                                    "message": f"Vous avez complété votre quête ! Plus que {quests_left} quête(s) pour vous enfuir !",
+                                    "video_path": video_path,
+                                    "quests_left": quests_left
+                                })
                                 
                                 # Reset rooms searched for Vision power
-                                game["rooms_searched_this_key"] = []
+                                game["_rooms_searched_this_key"].clear()
                                 game["active_quest"] = None
 
                                 # Place next quest if there are more to complete
-                                if len(game["completed_quests"]) < len(game["quests"]):
+                                if game["keys_collected"] < len(game["quests"]):
                                     # Find the next quest to place
-                                    next_quest_index = len(game["completed_quests"])
+                                    next_quest_index = game["keys_collected"]
                                     next_quest = game["quests"][next_quest_index]
                                     next_quest_room = place_quest(game, next_quest["class"])
                                     if next_quest_room:
@@ -2004,19 +2067,16 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                                             "player_id": next_quest["player_id"],
                                             "player_name": next_quest["player_name"]
                                         }
-                                        logger.info(f"Next quest placed for {next_quest['class']} in: {next_quest_room}")
+                                        logger.info("Next quest placed for %s in: %s", next_quest['class'], next_quest_room)
                             else:
                                 # Wrong class! Show required class popup
-                                try:
-                                    required_class_image = f"/requis/{quest_class}-requis.png"
-                                    await websocket.send_json({
-                                        "type": "wrong_class_popup",
-                                        "message": f"Cette quête nécessite la classe {quest_class}.",
-                                        "required_class": quest_class,
-                                        "required_class_image": required_class_image
-                                    })
-                                except:
-                                    pass
+                                required_class_image = f"/requis/{quest_class}-requis.png"
+                                send_to_player(session_id, player_id, {
+                                    "type": "wrong_class_popup",
+                                    "message": f"Cette quête nécessite la classe {quest_class}.",
+                                    "required_class": quest_class,
+                                    "required_class_image": required_class_image
+                                })
                                 
                                 # Log that a survivor tried but wrong class - only visible to survivors
                                 event_msg = f"🔍 {player['name']} explore {room_name} mais ne peut pas accomplir cette quête."
@@ -2042,57 +2102,33 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                             survivor_class = player.get("character_class", "Guerrier")  # Default to Guerrier if class not found
                             crystal_video = f"/event/Cristal_{survivor_class}.mp4"
                             
-                            # Send different messages based on role
-                            survivor_msg = "🎉 VICTOIRE ! Le cristal a été détruit ! Vous vous êtes échappés !"
-                            killer_msg = "💀 DEFAITE ! Le cristal a été détruit..."
-                            
-                            game["events"].append({"message": survivor_msg, "type": "game_over", "for_role": "survivor"})
-                            game["events"].append({"message": killer_msg, "type": "game_over", "for_role": "killer"})
-                            
-                            # Send game over to survivors with crystal destroyed video
-                            await broadcast_to_session(session_id, {
-                                "type": "game_over",
-                                "winner": "survivors",
-                                "message": survivor_msg,
-                                "video_path": crystal_video
-                            }, role_filter="survivor")
-                            
-                            # Send game over to killers with crystal destroyed video
-                            await broadcast_to_session(session_id, {
-                                "type": "game_over",
-                                "winner": "survivors",
-                                "message": killer_msg,
-                                "video_path": crystal_video
-                            }, role_filter="killer")
+                            await announce_game_over(session_id, "survivors", video_path=crystal_video)
                     
                     # GOLD SYSTEM: Give gold to survivor if not trapped (blizzard)
-                    if player["role"] == "survivor" and not game["rooms"][room_name].get("trap_triggered", False):
+                    if player["role"] == "survivor" and not room.get("trap_triggered", False):
                         # Generate gold reward
                         gold_amount, gold_image = generate_gold_reward()
                         player["gold"] += gold_amount
                         
                         # Send personal gold notification to this survivor only
-                        try:
-                            await websocket.send_json({
-                                "type": "gold_found",
-                                "message": f"Vous fouillez la pièce et trouvez {gold_amount} pièces d'or !",
-                                "gold_amount": gold_amount,
-                                "total_gold": player["gold"],
-                                "gold_image": gold_image
-                            })
-                        except:
-                            pass
+                        send_to_player(session_id, player_id, {
+                            "type": "gold_found",
+                            "message": f"Vous fouillez la pièce et trouvez {gold_amount} pièces d'or !",
+                            "gold_amount": gold_amount,
+                            "total_gold": player["gold"],
+                            "gold_image": gold_image
+                        })
                     
                     # Check if survivor enters room with mimic (AFTER gold is awarded)
-                    if player["role"] == "survivor" and game["rooms"][room_name].get("has_mimic", False):
+                    if player["role"] == "survivor" and room.get("has_mimic", False):
                         gold_stolen = player.get("gold", 0)
                         player["gold"] = 0
                         
                         # Clear mimic from room after it triggers
-                        game["rooms"][room_name]["has_mimic"] = False
+                        room["has_mimic"] = False
                         
                         # Send mimic notification immediately to the survivor with video
-                        await websocket.send_json({
+                        send_to_player(session_id, player_id, {
                             "type": "mimic_notification",
                             "message": f"💰 Vous croisez la mimic ! Attirée par votre or, elle vous poursuit ! Vous lachez vos {gold_stolen} pièces d'or pour rester en vie.",
                             "video_path": "/death/Mimic.mp4",
@@ -2103,18 +2139,13 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                     await broadcast_to_session(session_id, {
                         "type": "player_action",
                         "player_id": player_id,
-                        "player_name": game["players"][player_id]["name"],
+                        "player_name": player["name"],
                         "message": f"✅ {game['players'][player_id]['name']} a fait son choix"
                     })
 
                     # Check if all players of the current role have selected
                     if game["phase"] == "survivor_selection":
-                        alive_survivors = [p for p in game["players"].values()\
-                                         if p["role"] == "survivor" and not p["eliminated"]]
-                        survivors_selected = [pid for pid in game["pending_actions"].keys()\
-                                            if game["players"][pid]["role"] == "survivor"]
-
-                        if len(survivors_selected) == len(alive_survivors):
+                        if game["_alive_survivor_ids"] <= game["pending_actions"].keys():
                             # All survivors have selected, NOW clear traps and mimics from previous turn
                             # This ensures traps and mimics persist for exactly one turn after being set
                             for room_name, room_data in game["rooms"].items():
@@ -2127,12 +2158,10 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                             
                             # Move to killer power selection
                             game["phase"] = "killer_power_selection"
-                            game["pending_power_selections"] = {}
+                            game["pending_power_selections"].clear()
                             
                             # Assign 3 random powers to each killer
-                            alive_killers = [p for p in game["players"].values() if p["role"] == "killer" and not p["eliminated"]]
-                            for killer in alive_killers:
-                                killer_id = killer["id"]
+                            for killer_id in game["_alive_killer_ids"]:
                                 power_options = get_random_powers()
                                 game["pending_power_selections"][killer_id] = {
                                     "options": power_options,
@@ -2148,12 +2177,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                             })
 
                     elif game["phase"] == "killer_selection":
-                        alive_killers = [p for p in game["players"].values()\
-                                       if p["role"] == "killer" and not p["eliminated"]]
-                        killers_selected = [pid for pid in game["pending_actions"].keys()\
-                                          if game["players"][pid]["role"] == "killer"]
-
-                        if len(killers_selected) == len(alive_killers):
+                        if game["_alive_killer_ids"] <= game["pending_actions"].keys():
                             # All killers have selected, process the turn
                             game["phase"] = "processing"
                             await process_turn(session_id)
@@ -2176,7 +2200,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                 power_def = POWERS[power_name]
                 if power_def["requires_action"]:
                     game["pending_power_selections"][player_id]["action_complete"] = False
-                    await websocket.send_json({
+                    send_to_player(session_id, player_id, {
                         "type": "power_action_required",
                         "power": power_name,
                         "action_type": power_def["action_type"],
@@ -2187,7 +2211,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                     await broadcast_to_session(session_id, {
                         "type": "player_action",
                         "player_id": player_id,
-                        "player_name": game["players"][player_id]["name"],
+                        "player_name": player["name"],
                         "message": f"✅ {game['players'][player_id]['name']} a choisi son pouvoir"
                     })
                     
@@ -2212,7 +2236,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                 await broadcast_to_session(session_id, {
                     "type": "player_action",
                     "player_id": player_id,
-                    "player_name": game["players"][player_id]["name"],
+                    "player_name": player["name"],
                     "message": f"✅ {game['players'][player_id]['name']} a configuré son pouvoir"
                 })
                 
@@ -2221,29 +2245,31 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
 
             elif data["type"] == "use_medikit":
                 # Only survivors can use medikits
-                if game["players"][player_id]["role"] != "survivor":
+                if player["role"] != "survivor":
                     continue
 
-                if not game["players"][player_id]["has_medikit"]:
+                if not player["has_medikit"]:
                     continue
 
                 target_player_id = data["target_player_id"]
                 if target_player_id in game["players"] and game["players"][target_player_id]["eliminated"]:
                     target_room = game["players"][target_player_id]["current_room"]
-                    current_room = game["players"][player_id]["current_room"]
+                    current_room = player["current_room"]
 
                     if target_room == current_room:
                         # Revive player
-                        game["players"][target_player_id]["eliminated"] = False
+                        set_player_eliminated(game, target_player_id, False)
                         # Reset poison status when revived
                         game["players"][target_player_id]["poisoned_countdown"] = 0
-                        game["players"][player_id]["has_medikit"] = False
+                        player["has_medikit"] = False
 
-                        # Remove from eliminated list
-                        if target_player_id in game["rooms"][target_room]["eliminated_players"]:
+                        # Remove from eliminated list (kept as a list: it is ordered and rendered by the frontend)
+                        try:
                             game["rooms"][target_room]["eliminated_players"].remove(target_player_id)
+                        except ValueError:
+                            pass  # Died from toxin, never listed in the room
 
-                        event_msg = f"💚 {game['players'][player_id]['name']} a ranimé {game['players'][target_player_id]['name']} !"
+                        event_msg = f"💚 {player['name']} a ranimé {game['players'][target_player_id]['name']} !"
                         game["events"].append({"message": event_msg, "type": "revival"})
                         await broadcast_to_session(session_id, {"type": "event", "message": event_msg})
 
@@ -2255,14 +2281,10 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str, player_id: s
                             await broadcast_to_session(session_id, {"type": "event", "message": respawn_msg})
 
             # Broadcast updated state (filtered per player)
-            await broadcast_to_session(session_id, {
-                "type": "state_update",
-                "game": game_sessions[session_id]
-            })
+            mark_state_dirty(session_id)
 
     except WebSocketDisconnect:
-        if session_id in active_connections and player_id in active_connections[session_id]:
-            del active_connections[session_id][player_id]
+        drop_connection(session_id, player_id, connection)
 
 @api_router.get("/")
 async def root():
@@ -2276,6 +2298,21 @@ async def get_avatars():
         "killers": KILLER_AVATARS
     }
 
+@app.on_event("startup")
+async def check_single_worker():
+    # Sessions, connections and turn tasks live in this process only: with several workers,
+    # players of the same game would land on different workers and stop seeing each other
+    if int(os.environ.get("WEB_CONCURRENCY", "1")) > 1:
+        logger.warning("WEB_CONCURRENCY > 1: game state is per process, run a single worker per game server")
+
+@app.on_event("startup")
+async def start_session_reaper():
+    app.state.session_reaper = asyncio.create_task(reap_idle_sessions())
+
+@app.on_event("shutdown")
+async def stop_session_reaper():
+    app.state.session_reaper.cancel()
+
 # Include the router
 app.include_router(api_router)
 
@@ -2293,4 +2330,16 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
-logger = logging.getLogger(__name__)
\ No newline at end of file
+logger = logging.getLogger(__name__)
+
+if __name__ == "__main__":
+    import uvicorn
+    # uvloop has no Windows build (see requirements.txt), so fall back to the default loop there
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        workers=1,  # Game state is held in this process, see check_single_worker()
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
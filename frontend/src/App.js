@@ -1001,6 +1001,7 @@ const Game = () => {
   const ws = useRef(null);
   const eventsEndRef = useRef(null);
   const hasShownRoleNotification = useRef(false); // Track if role notification was shown
+  const serverState = useRef(null); // Last full game state from the WebSocket, base for state_patch
 
   useEffect(() => {
     // Get player_id from URL query params or localStorage
@@ -1035,19 +1036,32 @@ const Game = () => {
     // Connect WebSocket
     ws.current = new WebSocket(`${WS_URL}/api/ws/${sessionId}/${storedPlayerId}`);
 
-    ws.current.onmessage = (event) => {
-      const data = JSON.parse(event.data);
-
-      if (data.type === "state_update") {
-        setGameState(data.game);
+    const handleMessage = (data) => {
+      if (data.type === "turn_events") {
+        // Events produced during a turn are batched into one frame by the backend
+        data.events.forEach(handleMessage);
+      } else if (data.type === "state_update" || data.type === "state_patch") {
+        // state_patch only carries what changed since the last state: whole top-level fields,
+        // single rooms/players entries, and events appended to the log
+        const game = data.type === "state_update" ? data.game : { ...serverState.current, ...data.changes };
+        if (data.type === "state_patch") {
+          Object.entries(data.entries || {}).forEach(([field, entries]) => {
+            game[field] = { ...game[field], ...entries };
+          });
+          Object.entries(data.appended || {}).forEach(([field, { drop, items }]) => {
+            game[field] = game[field].slice(drop).concat(items);
+          });
+        }
+        serverState.current = game;
+        setGameState(game);
         
         // NEW: Check if conspiracy mode and game just started - show role notification ONCE
-        if (data.game.conspiracy_mode && 
-            data.game.game_started && 
-            storedPlayerId in data.game.players &&
+        if (game.conspiracy_mode && 
+            game.game_started && 
+            storedPlayerId in game.players &&
             !hasShownRoleNotification.current) {
           // Game just started in conspiracy mode - show role notification once
-          const myRole = data.game.players[storedPlayerId].role;
+          const myRole = game.players[storedPlayerId].role;
           setAssignedRole(myRole);
           setShowRoleNotification(true);
           hasShownRoleNotification.current = true; // Mark as shown
@@ -1230,6 +1244,8 @@ const Game = () => {
       }
     };
 
+    ws.current.onmessage = (event) => handleMessage(JSON.parse(event.data));
+
     return () => {
       if (ws.current) {
         ws.current.close();